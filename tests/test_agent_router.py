@@ -18,16 +18,23 @@ except ImportError:
 class TestAgentRouter(unittest.TestCase):
     """Test cases for the AgentRouter class."""
     
-    def setUp(self):
-        """Set up the test environment."""
+    @classmethod
+    def setUpClass(cls):
+        """Build one router for the whole class; __init__ compiles patterns."""
         # Configure a test logger
-        self.logger = logging.getLogger("test_logger")
-        self.logger.setLevel(logging.DEBUG)
+        cls.logger = logging.getLogger("test_logger")
+        cls.logger.setLevel(logging.DEBUG)
         # Use a null handler to prevent log output during tests
-        self.logger.addHandler(logging.NullHandler())
-        
-        # Create a test router
-        self.router = AgentRouter(logger=self.logger)
+        cls.logger.addHandler(logging.NullHandler())
+
+        # Create a test router shared across test methods
+        cls.router = AgentRouter(logger=cls.logger)
+
+    def setUp(self):
+        """Reset the shared router's mutable state between tests."""
+        self.router.routing_stats = {
+            agent_type: 0 for agent_type in self.router.error_patterns
+        }
     
     def test_init(self):
         """Test router initialization."""
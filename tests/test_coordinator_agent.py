@@ -19,6 +19,17 @@ except ImportError:
 class TestCoordinatorAgent(unittest.TestCase):
     """Test cases for the CoordinatorAgent class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory shared by the whole class."""
+        cls.temp_dir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary directory."""
+        import shutil
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
     def setUp(self):
         """Set up the test environment."""
         # Configure a test logger
@@ -26,15 +37,16 @@ class TestCoordinatorAgent(unittest.TestCase):
         self.logger.setLevel(logging.DEBUG)
         # Use a null handler to prevent log output during tests
         self.logger.addHandler(logging.NullHandler())
-        
-        # Create a temporary directory for test files
-        self.temp_dir = tempfile.mkdtemp()
-        
+
+        # Each test saves under its own subdirectory of the shared tempdir
+        # (created lazily by the coordinator, not here)
+        self.save_dir = os.path.join(self.temp_dir, self._testMethodName)
+
         # Create a test coordinator agent with dry run mode enabled
         self.coordinator = CoordinatorAgent(
             name="TestCoordinator",
             logger=self.logger,
-            save_directory=self.temp_dir,
+            save_directory=self.save_dir,
             dry_run=True
         )
         
@@ -51,12 +63,6 @@ class TestCoordinatorAgent(unittest.TestCase):
         self.coordinator.register_specialist("deployment_error", self.deployment_agent)
         self.coordinator.register_specialist("azure_error", self.azure_agent)
     
-    def tearDown(self):
-        """Clean up after the tests."""
-        # Clean up any temporary files
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
     def test_init(self):
         """Test coordinator initialization."""
         self.assertEqual(self.coordinator.name, "TestCoordinator")
@@ -5,6 +5,21 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Authenticated PyGithub clients cached per token: each client keeps a
+# pooled HTTPS connection to api.github.com, so reusing one avoids a fresh
+# TCP + TLS handshake on every issue creation
+_GITHUB_CLIENTS: Dict[str, object] = {}
+
+
+def _get_github_client(token: str):
+    """Return a cached authenticated Github client for this token."""
+    client = _GITHUB_CLIENTS.get(token)
+    if client is None:
+        from github import Github
+        client = Github(token)
+        _GITHUB_CLIENTS[token] = client
+    return client
+
 def create_github_issue(issue_details: Dict, repo_owner: Optional[str] = None, 
                        repo_name: Optional[str] = None, github_token: Optional[str] = None) -> str:
     """
@@ -66,15 +81,13 @@ def create_github_issue(issue_details: Dict, repo_owner: Optional[str] = None,
     if github_token and repo_owner and repo_name:
         try:
             print(f"  Attempting to create issue in {repo_owner}/{repo_name}...")
+            # Handle token format - make sure it doesn't have any whitespace
+            clean_token = github_token.strip()
             try:
-                from github import Github
+                g = _get_github_client(clean_token)
             except ImportError:
                 print(f"\n❌ PyGithub not installed")
                 return f"Failed to create GitHub issue: PyGithub not installed. Run 'pip install PyGithub'"
-                
-            # Handle token format - make sure it doesn't have any whitespace
-            clean_token = github_token.strip()
-            g = Github(clean_token)
             
             # Verify authentication before attempting to create issue
             try:
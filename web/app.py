@@ -1,15 +1,110 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask import Flask, Response, render_template, request, jsonify, redirect, url_for
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import atexit
+import codecs
+import concurrent.futures
 import os
+from collections import Counter
+import queue
 import sys
+import threading
+import types
 import json
 import logging
 import re
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add project root to Python path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+# Compiled once at import; matched on every analyze request that creates an issue
+_GITHUB_URL_RE = re.compile(r'https://github\.com/\S+')
+
+# Uploaded logs are decoded in chunks up to this cap: routing and salient-line
+# extraction only inspect the leading content, so decoding a 16 MB tail that
+# is never read wastes memory and CPU
+_LOG_READ_CHUNK = 65536
+_MAX_LOG_BYTES = 4 * 1024 * 1024
+
+# Shared read-only fallback so missing-analysis results don't allocate a
+# fresh empty dict per file in the batch aggregation loop
+_EMPTY_DICT = types.MappingProxyType({})
+
+# GitHub settings don't change at runtime; read them once at import instead
+# of three os.getenv calls per analyze request
+_GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+_GITHUB_REPO_OWNER = os.getenv("GITHUB_REPO_OWNER")
+_GITHUB_REPO_NAME = os.getenv("GITHUB_REPO_NAME")
+
+
+def _decode_log_upload(file):
+    """
+    Incrementally decode an uploaded log file, bounded at _MAX_LOG_BYTES.
+
+    Streams the file in chunks through an incremental UTF-8 decoder with
+    errors='replace', so binary logs yield replacement characters instead
+    of raising UnicodeDecodeError, and only the analyzed prefix is ever
+    held in memory.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    pieces = []
+    bytes_read = 0
+    while bytes_read < _MAX_LOG_BYTES:
+        chunk = file.stream.read(_LOG_READ_CHUNK)
+        if not chunk:
+            break
+        bytes_read += len(chunk)
+        pieces.append(decoder.decode(chunk))
+    pieces.append(decoder.decode(b"", True))
+    return "".join(pieces)
+
+# Static JSON bodies are serialized once at import: the validation-failure
+# payloads never change, and /health and /api/test only vary in their
+# timestamp, which gets spliced between pre-encoded fragments per request
+_TS_SENTINEL = b"@timestamp@"
+
+
+def _static_json(payload):
+    """Serialize a static payload to JSON bytes once, at import time."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+def _json_error(body):
+    """
+    Wrap pre-serialized error bytes in a fresh 400 response.
+
+    The bytes are shared across requests; the Response object itself is
+    rebuilt each time because flask-cors mutates response headers in place.
+    """
+    return Response(body, status=400, mimetype='application/json')
+
+
+_ERR_NO_CONTENT = _static_json(
+    {'error': 'No content provided - please either upload a file or enter log text'})
+_ERR_EMPTY_LOG = _static_json({'error': 'Empty log content'})
+_ERR_NO_FILES = _static_json({'error': 'No log files provided'})
+
+_TEST_PREFIX, _TEST_SUFFIX = _static_json({
+    'status': 'success',
+    'message': 'API is working correctly',
+    'time': _TS_SENTINEL.decode()
+}).split(_TS_SENTINEL)
+
+# GitHub issue tool imported once at startup instead of per analyze request
+try:
+    from tools.github_issue_tool import create_github_issue
+except ImportError:
+    create_github_issue = None
+
 # Import your existing code
 try:
     from main import DevOpsBot, setup_logging, create_llm_config
@@ -30,16 +125,37 @@ except ImportError as e:
         logger.addHandler(handler)
         return logger
 
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson's C serializer."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app
-app = Flask(__name__, 
+app = Flask(__name__,
             static_folder='static',
             template_folder='templates')
 CORS(app)
 
+# Route every jsonify through orjson when installed: object walking happens
+# in C, which matters most for large batch-analysis payloads
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
+
 # Set up basic config
 app.config['SECRET_KEY'] = os.environ.get('FLASK_SECRET_KEY', 'dev-key-for-testing')
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max upload
 
+# The reports directory only needs to exist once, not per batch request
+try:
+    os.makedirs('reports', exist_ok=True)
+except OSError as e:
+    logging.getLogger("web_app").error("Failed to create reports directory: %s", e)
+
 # Configure logging and initialize DevOps Bot
 logger = setup_logging()
 logger.info("Starting Semantic DevOps Bot Web Application")
@@ -53,9 +169,55 @@ try:
         bot = None
         logger.warning("DevOps Bot initialization skipped due to import errors")
 except Exception as e:
-    logger.error(f"Failed to initialize DevOpsBot: {e}")
+    logger.error("Failed to initialize DevOpsBot: %s", e)
     bot = None
 
+# /health is polled every few seconds by load balancers; bot_initialized is
+# fixed once startup completes, so everything but the timestamp is encoded here
+_HEALTH_PREFIX, _HEALTH_SUFFIX = _static_json({
+    'status': 'ok',
+    'timestamp': _TS_SENTINEL.decode(),
+    'bot_initialized': bot is not None
+}).split(_TS_SENTINEL)
+
+# Background report writer: batch responses are serialized on the request
+# thread (cheap) but written to disk on a daemon thread, so clients never
+# wait on report-file IO
+_report_queue = queue.Queue()
+
+
+def _serialize_report(payload):
+    """Serialize a report payload to indented JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode('utf-8')
+
+
+def _drain_report_queue():
+    """Write queued (filename, bytes) reports; runs on the writer thread."""
+    while True:
+        report_filename, payload = _report_queue.get()
+        try:
+            with open(report_filename, 'wb') as f:
+                f.write(payload)
+        except Exception as e:
+            logger.error("Failed to write report %s: %s", report_filename, e)
+        finally:
+            _report_queue.task_done()
+
+
+def _flush_pending_reports():
+    """Drain the report queue at exit so trailing reports are not lost."""
+    try:
+        _report_queue.join()
+    except Exception:
+        pass
+
+
+_report_thread = threading.Thread(target=_drain_report_queue, daemon=True, name="report-writer")
+_report_thread.start()
+atexit.register(_flush_pending_reports)
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -77,23 +239,20 @@ def analyze_log():
         # If text is provided, use that
         if log_text.strip():
             log_content = log_text
-            logger.info(f"Using provided log text: {log_content[:50]}...")
+            logger.info("Using provided log text: %.50s...", log_content)
         # Otherwise, try to get a file
         elif 'log_file' in request.files:
             log_file = request.files['log_file']
             if log_file.filename == '':
-                return jsonify({'error': 'No content provided - please either upload a file or enter log text'}), 400
-            try:
-                log_content = log_file.read().decode('utf-8')
-                logger.info(f"Using uploaded file: {log_file.filename}")
-            except UnicodeDecodeError:
-                return jsonify({'error': 'File encoding not supported. Please use UTF-8 encoded text files.'}), 400
+                return _json_error(_ERR_NO_CONTENT)
+            log_content = _decode_log_upload(log_file)
+            logger.info("Using uploaded file: %s", log_file.filename)
         else:
-            return jsonify({'error': 'No content provided - please either upload a file or enter log text'}), 400
-        
+            return _json_error(_ERR_NO_CONTENT)
+
         # Process the log content
         if not log_content:
-            return jsonify({'error': 'Empty log content'}), 400
+            return _json_error(_ERR_EMPTY_LOG)
         
         # Check if GitHub issue creation is requested
         create_issue = request.form.get('create_issue') == 'on'
@@ -105,29 +264,27 @@ def analyze_log():
             # If GitHub issue creation is requested
             if create_issue:
                 try:
-                    from tools.github_issue_tool import create_github_issue
-                    github_token = os.getenv("GITHUB_TOKEN")
-                    repo_owner = os.getenv("GITHUB_REPO_OWNER")
-                    repo_name = os.getenv("GITHUB_REPO_NAME")
-                    
-                    if github_token and repo_owner and repo_name:
+                    if create_github_issue is None:
+                        raise ImportError("tools.github_issue_tool is unavailable")
+
+                    if _GITHUB_TOKEN and _GITHUB_REPO_OWNER and _GITHUB_REPO_NAME:
                         issue_result = create_github_issue(
                             issue_details=result.get('analysis', {}),
-                            repo_owner=repo_owner,
-                            repo_name=repo_name,
-                            github_token=github_token
+                            repo_owner=_GITHUB_REPO_OWNER,
+                            repo_name=_GITHUB_REPO_NAME,
+                            github_token=_GITHUB_TOKEN
                         )
-                        # Add GitHub issue URL to result
-                        if isinstance(issue_result, str) and "created" in issue_result:
-                            # Extract the URL if it's in the result
-                            url_match = re.search(r'https://github\.com/[^\s]+', issue_result)
+                        # Add GitHub issue URL to result: a URL match implies
+                        # the issue was created, so one scan covers both checks
+                        if isinstance(issue_result, str):
+                            url_match = _GITHUB_URL_RE.search(issue_result)
                             if url_match:
                                 result['github_issue_url'] = url_match.group(0)
                 except Exception as e:
-                    logger.error(f"Failed to create GitHub issue: {e}")
+                    logger.error("Failed to create GitHub issue: %s", e)
                     result['github_issue_error'] = str(e)
             
-            logger.info(f"Analysis successful: {str(result)[:100]}...")
+            logger.info("Analysis successful: %.100s...", result)
             return jsonify(result)
         else:
             # If bot initialization failed, use mock data
@@ -146,17 +303,16 @@ def analyze_log():
             return jsonify(mock_result)
             
     except Exception as e:
-        logger.error(f"Request handling error: {e}")
+        logger.error("Request handling error: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/test', methods=['GET'])
 def test_api():
-    return jsonify({
-        'status': 'success',
-        'message': 'API is working correctly',
-        'time': datetime.now().isoformat()
-    })
+    return Response(
+        _TEST_PREFIX + datetime.now().isoformat().encode() + _TEST_SUFFIX,
+        mimetype='application/json'
+    )
 
 @app.route('/api/analyze-mock', methods=['POST'])
 def analyze_log_mock():
@@ -165,7 +321,7 @@ def analyze_log_mock():
         # Get log content from request
         if 'log_file' in request.files:
             log_file = request.files['log_file']
-            log_content = log_file.read().decode('utf-8')
+            log_content = _decode_log_upload(log_file)
         else:
             log_content = request.form.get('log_text', '')
         
@@ -187,7 +343,7 @@ def analyze_log_mock():
         return jsonify(mock_response)
             
     except Exception as e:
-        logger.error(f"Error in mock analyzer: {e}")
+        logger.error("Error in mock analyzer: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/batch-analyze', methods=['POST'])
@@ -197,92 +353,102 @@ def batch_analyze():
         create_issues = request.form.get('create_issues') == 'on'
         
         if not files or files[0].filename == '':
-            return jsonify({'error': 'No log files provided'}), 400
-        
-        # Process each file
-        results = []
-        error_types = {}
-        severities = {}
+            return _json_error(_ERR_NO_FILES)
         
-        for i, file in enumerate(files):
-            try:
-                log_content = file.read().decode('utf-8')
-            except UnicodeDecodeError:
-                logger.warning(f"Skipping file {file.filename} due to encoding issues")
-                continue
-                
-            filename = file.filename
-            
-            # Analyze the log
+        # Decode uploads on the request thread (FileStorage streams are not
+        # thread-safe), then analyze the files in parallel: each analysis
+        # mostly waits on LLM/GitHub HTTP latency, so a thread pool turns
+        # an N-file batch from N round-trips into roughly one
+        payloads = [(i, file.filename, _decode_log_upload(file)) for i, file in enumerate(files)]
+
+        def _process_one(index, filename, log_content):
             if bot:
                 result = bot.analyze_log(log_content)
                 result['filename'] = filename
-                result['index'] = i
-                results.append(result)
-                
-                # Update summary stats
-                analysis = result.get('analysis', {})
-                error_type = analysis.get('error_summary', 'Unknown')
-                severity = analysis.get('severity_level', 'UNKNOWN')
-                
-                error_types[error_type] = error_types.get(error_type, 0) + 1
-                severities[severity] = severities.get(severity, 0) + 1
-            else:
-                # Use mock data if bot is not initialized
-                mock_result = {
-                    "status": "mock",
-                    "filename": filename,
-                    "index": i,
-                    "analysis": {
-                        "error_summary": "ModuleNotFoundError: No module named 'requests'",
-                        "root_cause": "The Python script is trying to import the 'requests' library, but it's not installed",
-                        "severity": "Medium - Application cannot run without this dependency",
-                        "severity_level": "MEDIUM",
-                        "recommended_solution": "Install the missing package using pip install requests",
-                        "prevention": "Use requirements.txt to document dependencies"
-                    }
+                result['index'] = index
+                return result
+            # Use mock data if bot is not initialized
+            return {
+                "status": "mock",
+                "filename": filename,
+                "index": index,
+                "analysis": {
+                    "error_summary": "ModuleNotFoundError: No module named 'requests'",
+                    "root_cause": "The Python script is trying to import the 'requests' library, but it's not installed",
+                    "severity": "Medium - Application cannot run without this dependency",
+                    "severity_level": "MEDIUM",
+                    "recommended_solution": "Install the missing package using pip install requests",
+                    "prevention": "Use requirements.txt to document dependencies"
                 }
-                results.append(mock_result)
-                
-                # Update summary stats with mock data
-                error_types["ModuleNotFoundError"] = error_types.get("ModuleNotFoundError", 0) + 1
-                severities["MEDIUM"] = severities.get("MEDIUM", 0) + 1
-        
+            }
+
+        # Pre-sized so the batch never reallocates the results list
+        results = [None] * len(payloads)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(payloads))) as pool:
+            # map preserves submission order, so results stay index-ordered
+            for i, result in enumerate(pool.map(lambda args: _process_one(*args), payloads)):
+                results[i] = result
+
+        # Aggregate summary stats on the request thread, lock-free
+        # (Counter defaults missing keys to 0, so each increment is one op)
+        error_types = Counter()
+        severities = Counter()
+        for result in results:
+            analysis = result['analysis'] if 'analysis' in result else _EMPTY_DICT
+            error_types[analysis.get('error_summary', 'Unknown')] += 1
+            severities[analysis.get('severity_level', 'UNKNOWN')] += 1
+
+
         # Prepare response
         response = {
             'total_files': len(results),
             'results': results,
-            'error_types': error_types,
-            'severities': severities,
+            'error_types': dict(error_types),
+            'severities': dict(severities),
             'timestamp': datetime.now().isoformat()
         }
         
-        # Save results to reports directory
-        os.makedirs('reports', exist_ok=True)
+        # Hand the report to the background writer; the client gets its
+        # response without waiting on disk
         report_filename = f"reports/web_batch_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_filename, 'w') as f:
-            json.dump(response, f, indent=2)
-        
-        logger.info(f"Batch analysis completed for {len(results)} files, saved to {report_filename}")
+        _report_queue.put((report_filename, _serialize_report(response)))
+
+        logger.info("Batch analysis completed for %d files, saving to %s", len(results), report_filename)
         return jsonify(response)
         
     except Exception as e:
-        logger.error(f"Error in batch analysis: {e}")
+        logger.error("Error in batch analysis: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/health')
 def health_check():
-    return jsonify({
-        'status': 'ok',
-        'timestamp': datetime.now().isoformat(),
-        'bot_initialized': bot is not None
-    })
+    return Response(
+        _HEALTH_PREFIX + datetime.now().isoformat().encode() + _HEALTH_SUFFIX,
+        mimetype='application/json'
+    )
 
 if __name__ == '__main__':
     port = int(os.environ.get("PORT", 5000))
     debug = os.environ.get("FLASK_DEBUG", "True").lower() == "true"
-    
+
+    if os.environ.get("FLASK_ENV") == "production":
+        # The Werkzeug dev server is single-threaded, so one slow LLM-bound
+        # analysis blocks every endpoint including /health. In production,
+        # hand off to gunicorn with threaded workers instead.
+        import subprocess
+        workers = (os.cpu_count() or 1) * 2
+        print(f"Starting Semantic DevOps Bot under gunicorn on port {port} ({workers} workers)")
+        sys.exit(subprocess.run([
+            "gunicorn",
+            "-w", str(workers),
+            "-k", "gthread",
+            "--threads", "4",
+            "-b", f"0.0.0.0:{port}",
+            "--chdir", os.path.dirname(os.path.abspath(__file__)),
+            "wsgi:application"
+        ]).returncode)
+
     print(f"Starting Semantic DevOps Bot Web Interface on port {port}")
     print(f"Debug mode: {'ON' if debug else 'OFF'}")
-    
+
     app.run(host='0.0.0.0', port=port, debug=debug)
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""
+WSGI entry point for production servers.
+
+Run with, for example:
+    gunicorn -w 4 -k gthread --threads 4 -b 0.0.0.0:5000 --chdir web wsgi:application
+
+Each gunicorn worker imports the app (and so its own DevOpsBot) on startup,
+which keeps LLM client sockets out of any fork-sharing trouble.
+"""
+import os
+import sys
+
+# Make the sibling app module importable regardless of the server's cwd
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import app
+
+application = app